@@ -1,16 +1,671 @@
 from datetime import date, timedelta
+import numpy as np
 import pandas as pd
 from faker import Faker
-import random
 import re
 import os
 import itertools
+import csv
+import io
+import sys
+import sqlite3
+from contextlib import closing, redirect_stdout
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below then run as plain Python/NumPy
+    njit = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pa_parquet
+except ImportError:  # pyarrow is optional; save_table then always writes through pandas
+    pa = None
+
+# only the providers the generators below actually use (company is needed by internet's domain names);
+# skipping the other locale providers makes the shared instance cheaper to build
+faker_providers = [
+    "faker.providers.person",
+    "faker.providers.company",
+    "faker.providers.internet",
+    "faker.providers.misc",
+    "faker.providers.phone_number",
+    "faker.providers.date_time",
+    "faker.providers.address",
+    "faker.providers.lorem",
+]
+
+fake = Faker(providers=faker_providers, use_weighting=False)
+
+# Faker provider methods bound once, so hot loops skip the proxy attribute lookup on every call
+_fake_name = fake.name
+_fake_user_name = fake.user_name
+_fake_password = fake.password
+_fake_phone = fake.phone_number
+_fake_dob = fake.date_of_birth
+_fake_street = fake.street_address
+_fake_city = fake.city
+_fake_country = fake.country
+_fake_date_decade = fake.date_this_decade
+_fake_dt_year = fake.date_time_this_year
+_fake_date_year = fake.date_this_year
+_fake_text = fake.text
+_fake_image_url = fake.image_url
+_fake_first_name = fake.first_name
+
+# precompiled so phone normalisation doesn't go through re's pattern cache on every user
+_NON_DIGIT = re.compile(r'\D')
+
+def _jit(func):
+    # compile numeric kernels with Numba when it is installed, otherwise leave them as they are
+    return njit(cache=True)(func) if njit is not None else func
+
+
+@_jit
+def _compute_booking_totals(nights, prices, discounts):
+    base_amounts = nights * prices
+    return np.round(base_amounts - (base_amounts * (discounts / 100)), 2)
+
+
+@_jit
+def _mark_unavailable(availability_matrix, rows, check_in_offsets, check_out_offsets):
+    for i in range(len(rows)):
+        availability_matrix[rows[i], check_in_offsets[i]:check_out_offsets[i]] = False
+
+
+@_jit
+def _sample_unused_codes(generator, used_bits, num_codes, num_samples):
+    # rejection-sample distinct codes in [0, num_codes), tracking taken codes in a uint64 bitset
+    codes = np.empty(num_samples, dtype=np.int64)
+    found = 0
+    while found < num_samples:
+        code = generator.integers(0, num_codes)
+        word = code >> 6
+        bit = np.uint64(1) << np.uint64(code & 63)
+        if used_bits[word] & bit == 0:
+            used_bits[word] |= bit
+            codes[found] = code
+            found += 1
+    return codes
+
+
+@_jit
+def _missing_id_mask(ids, reference_ids):
+    # flag the ids absent from reference_ids, using a presence table over the non-negative ID range
+    size = 0
+    for i in range(len(reference_ids)):
+        if reference_ids[i] >= size:
+            size = reference_ids[i] + 1
+    present = np.zeros(size, dtype=np.bool_)
+    for i in range(len(reference_ids)):
+        if reference_ids[i] >= 0:
+            present[reference_ids[i]] = True
+    missing = np.empty(len(ids), dtype=np.bool_)
+    for i in range(len(ids)):
+        missing[i] = ids[i] < 0 or ids[i] >= size or not present[ids[i]]
+    return missing
+
+
+# shared NumPy generator for all non-Faker randomness in the table generators; reseeded per worker by set_seed
+rng = np.random.default_rng()
+
+# a local directory for saving files; created by the table writers when they first write into it
+output_directory = "output_data"
 
-fake = Faker()
+# write buffer used for every CSV export (1 MiB)
+csv_buffer_size = 1 << 20
+
+# rows formatted per batch by save_table (pandas to_csv chunksize, pyarrow batch_size) and stream_table
+csv_chunk_rows = 50_000
+
+# file format every table writer produces: "csv", or "parquet" (zstd-compressed, requires pyarrow) when the
+# output is only handed to other tools and the cost of formatting every cell as text is not wanted
+table_file_format = "csv"
+
+# rows per Parquet row group when table_file_format is "parquet"
+parquet_row_group_rows = 200_000
+
+# single SQLite database main(aggregate=True) writes every table into, instead of one file per table
+aggregate_filename = "dataset.sqlite"
+
+# most offending IDs a validation message lists before summarising the rest as a count
+max_reported_ids = 10
+
+# largest ID the compiled reference checks (missing_id_mask) build a presence table for; bigger IDs use isin
+id_lookup_table_limit = 1 << 26
+
+# set in main's workers in aggregate mode, where main saves all tables into aggregate_filename at the end,
+# and when main runs without an output directory; the table writers then skip their own files
+defer_table_writes = False
+
+# upper bound on distinct Faker first names drawn per city table; city names are sampled from this pool
+city_name_pool_size = 300
+
+# number of distinct values generated per Faker-backed column by sample_faker_pool
+faker_pool_size = 256
+
+# Arrow-backed string dtype for the large free-text columns (see as_text_columns); plain strings without pyarrow
+text_column_dtype = pd.StringDtype("pyarrow") if pa is not None else None
+
+# re-check that generated foreign keys exist in their parent table; the generators only draw IDs from
+# the parent tables, so this is a debugging aid and is off by default
+validate_generated_ids = False
+
+# largest pair-code space sample_covering_pairs enumerates with np.arange;
+# bigger spaces are sampled through the sample_unused_codes bitset sampler instead
+pair_code_materialize_limit = 1 << 22
+
+# draws taking at most this share of the free pair codes also go through the bitset sampler, where
+# rejections stay rare and no code range has to be enumerated; the choice depends on sizes only, so
+# the sampled pairs are the same with and without Numba
+sparse_pair_draw_fraction = 0.5
+
+# module settings main hands to its pool workers (see configure_worker), so changes a caller makes to them
+# before calling main also reach workers that re-import this module instead of being forked
+worker_setting_names = (
+    "csv_buffer_size", "csv_chunk_rows", "table_file_format", "parquet_row_group_rows", "max_reported_ids",
+    "id_lookup_table_limit", "city_name_pool_size", "faker_pool_size", "validate_generated_ids",
+    "pair_code_materialize_limit", "sparse_pair_draw_fraction",
+)
+
+# base nightly price per property type, scaled by generate_dynamic_price / populate_price_table
+property_base_prices = {
+    "apartment": 50,
+    "villa": 100,
+    "house": 80,
+    "studio": 40,
+    "cabin": 60,
+    "boathouse": 90
+}
+
+# profile URL prefixes used by generate_social_network_url / generate_social_network_urls
+social_network_base_urls = {
+    "Twitter": "https://twitter.com",
+    "Facebook": "https://facebook.com",
+    "Instagram": "https://instagram.com",
+    "LinkedIn": "https://linkedin.com/in"
+}
+
+# networks assigned by populate_profile_table / populate_social_network_table
+social_network_names = np.array(["Facebook", "Twitter", "Instagram", "LinkedIn"], dtype=object)
+
+# admin roles and their selection weights in populate_admin_table
+admin_roles = np.array(["SuperAdmin", "Admin", "Moderator"], dtype=object)
+admin_role_weights = np.array([30, 50, 20]) / 100
+
+# payment methods and transaction types sampled by populate_transaction_table
+payment_methods = np.array(["Credit Card", "Debit Card", "Bank Transfer", "PayPal", "Cryptocurrency"], dtype=object)
+transaction_types = np.array(["Credit", "Debit"], dtype=object)
+
+# review texts sampled by generate_realistic_review / populate_review_table
+review_sentiments = np.array([
+    "Excellent stay!", "Highly recommended!", "A very cozy place.",
+    "Would definitely book again.", "The amenities were great.",
+    "Perfect location!", "Wonderful host!", "A bit noisy but manageable.",
+    "Loved the view!", "Clean and comfortable.", "A true home away from home.",
+    "Met all my expectations.", "The pool was fantastic!", "Convenient and affordable.",
+    "I'll be coming back for sure.", "Forever am I at work here."
+], dtype=object)
+
+# actions sampled by populate_admin_action_table
+admin_action_descriptions = np.array([
+    "Updated user profile",
+    "Moderated a review",
+    "Deleted a comment",
+    "Resolved a user complaint",
+    "Banned a user",
+    "Approved new accommodation",
+    "Changed booking status",
+    "Reviewed system logs"
+], dtype=object)
+
+# components combined by generate_diverse_bio / generate_diverse_bios
+bio_hobbies = np.array([
+    "travels the world", "is a food lover", "enjoys hiking",
+    "loves painting", "is a marathon runner", "plays the guitar",
+    "writes poetry", "is a bookworm", "photographs wildlife",
+    "dances salsa"
+])
+bio_professions = np.array([
+    "a software developer", "a teacher", "a chef",
+    "a photographer", "an entrepreneur", "a designer",
+    "a fitness trainer", "a musician", "an author",
+    "a scientist"
+])
+bio_traits = np.array([
+    "passionate", "dedicated", "creative", "ambitious",
+    "curious", "outgoing", "kind-hearted", "driven",
+    "optimistic", "thoughtful"
+])
+bio_aspirations = np.array([
+    "to explore new cultures", "to change the world",
+    "to inspire others", "to write a best-selling novel",
+    "to innovate in technology", "to create stunning art",
+    "to lead a healthier life", "to start a global movement",
+    "to build meaningful connections", "to learn something new every day"
+])
 
-# a local directory for saving files
-output_directory = "output_data"
-os.makedirs(output_directory, exist_ok=True)
+"""
+Function: output_file_path
+
+Purpose:
+Builds the path of a file in an output directory, creating the directory when it does not exist yet. The 
+writers call this only when they actually write, so importing the module or running `main(output_dir=None)` 
+leaves the disk untouched.
+
+Parameters:
+- output_filename (str): The name of the file inside the directory.
+- output_dir (str, optional): The directory (default: `output_directory`).
+
+Returns:
+- The path of the file.
+"""
+def output_file_path(output_filename, output_dir=None):
+    output_dir = output_directory if output_dir is None else output_dir
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, output_filename)
+
+"""
+Function: open_output_file
+
+Purpose:
+Opens a file in the output directory with the shared CSV write buffer. Every table writer goes through 
+this helper, so the path handling and buffering are defined in one place.
+
+Parameters:
+- output_filename (str): The name of the file inside `output_directory`.
+- mode (str): "wb" (default) for a raw binary handle handed to pandas/pyarrow, or "w" for a text handle 
+  used with `csv.writer`.
+
+Returns:
+- The open file object; its `name` attribute holds the path of the file.
+"""
+def open_output_file(output_filename, mode="wb"):
+    file_path = output_file_path(output_filename)
+    if "b" in mode:
+        return open(file_path, mode, buffering=csv_buffer_size)
+    return open(file_path, mode, newline="", buffering=csv_buffer_size)
+
+"""
+Function: save_table
+
+Purpose:
+Writes a generated table to a CSV file in the output directory. The file is opened once as a raw binary 
+handle with a large write buffer, so the formatted rows are flushed in big blocks instead of many small writes.
+
+Parameters:
+- df (DataFrame): The table to save.
+- output_filename (str): The name of the output CSV file.
+
+Key Features:
+- Formats the rows with pyarrow's native CSV writer when pyarrow is installed and every column is a plain 
+  NumPy integer column. The header comes from pandas, because pyarrow quotes header names (and string 
+  cells) where pandas does not, so the file is byte-identical either way.
+- Falls back to `DataFrame.to_csv` for all other tables (strings, floats, booleans, dates, categoricals), 
+  when pyarrow is not available, and on platforms whose line terminator is not "\\n".
+- Writes purely numeric tables (such as prices) with `csv.QUOTE_NONE`, since none of their cells can 
+  require quoting.
+- Formats `csv_chunk_rows` rows per batch in both writers, regardless of the column count; pandas' own 
+  default shrinks the batch as tables get wider and pyarrow's stops at 1024 rows.
+- Writes a Parquet file instead when `table_file_format` is "parquet" (see `save_table_chunks`).
+- Skips the file entirely when `defer_table_writes` is set (see `save_tables_to_database`).
+
+Returns:
+- The path of the written file.
+"""
+def save_table(df, output_filename):
+    if defer_table_writes:
+        return deferred_table_path(output_filename)
+    if table_file_format == "parquet":
+        return save_table_chunks([df], output_filename)
+
+    with open_output_file(output_filename) as handle:
+        if pa is not None and _arrow_csv_compatible(df):
+            handle.write(df.head(0).to_csv(index=False).encode())
+            pa_csv.write_csv(
+                pa.Table.from_pandas(df, preserve_index=False),
+                handle,
+                write_options=pa_csv.WriteOptions(include_header=False, batch_size=csv_chunk_rows)
+            )
+        elif all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+            # numeric cells never need quoting, so skip pandas' per-cell quoting checks
+            df.to_csv(handle, index=False, quoting=csv.QUOTE_NONE, chunksize=csv_chunk_rows)
+        else:
+            df.to_csv(handle, index=False, chunksize=csv_chunk_rows)
+    return handle.name
+
+
+def _arrow_csv_compatible(df):
+    # pyarrow renders floats, booleans and timestamps differently from pandas and quotes every string cell,
+    # and it always ends rows with "\n"; only plain integer tables come out byte-identical to to_csv
+    return os.linesep == "\n" and all(
+        isinstance(column.dtype, np.dtype) and column.dtype.kind in "iu" for _, column in df.items()
+    )
+
+
+"""
+Function: save_table_chunks
+
+Purpose:
+Writes a table that arrives as a sequence of DataFrame chunks with the same columns to one output file, so 
+only one chunk needs to exist in memory at a time.
+
+Parameters:
+- chunks (iterable): The DataFrame chunks, in output order.
+- output_filename (str): The name of the output file; with `table_file_format` "parquet" its extension is 
+  replaced by ".parquet".
+
+Key Features:
+- Appends the chunks to one buffered CSV handle, writing the header only with the first chunk.
+- In "parquet" mode, writes each chunk as zstd-compressed row groups of up to `parquet_row_group_rows` rows 
+  through one `ParquetWriter`, skipping the text formatting of every cell entirely.
+
+Returns:
+- The path of the written file.
+"""
+def save_table_chunks(chunks, output_filename):
+    if defer_table_writes:
+        return deferred_table_path(output_filename)
+    if table_file_format == "parquet":
+        if pa is None:
+            raise ValueError("Parquet output requires pyarrow to be installed.")
+        file_path = output_file_path(os.path.splitext(output_filename)[0] + ".parquet")
+        writer = None
+        try:
+            for df_chunk in chunks:
+                table = pa.Table.from_pandas(df_chunk, preserve_index=False)
+                if writer is None:
+                    writer = pa_parquet.ParquetWriter(file_path, table.schema, compression="zstd")
+                writer.write_table(table, row_group_size=parquet_row_group_rows)
+        finally:
+            if writer is not None:
+                writer.close()
+        return file_path
+
+    with open_output_file(output_filename) as handle:
+        for i, df_chunk in enumerate(chunks):
+            df_chunk.to_csv(handle, index=False, header=(i == 0), chunksize=csv_chunk_rows)
+    return handle.name
+
+
+"""
+Function: deferred_table_path
+
+Purpose:
+Names the place a table will be saved when `defer_table_writes` is set, so the generators can still report 
+where their output goes.
+
+Parameters:
+- output_filename (str): The file name the table would otherwise be written to.
+
+Returns:
+- A string of the form "<output_directory>/<aggregate_filename>:<table name>", or "memory:<table name>" when 
+  `output_directory` is None and the table is not saved at all.
+"""
+def deferred_table_path(output_filename):
+    table_name = os.path.splitext(output_filename)[0]
+    if output_directory is None:
+        return f"memory:{table_name}"
+    return f"{os.path.join(output_directory, aggregate_filename)}:{table_name}"
+
+"""
+Function: save_tables_to_database
+
+Purpose:
+Saves a whole set of generated tables into one SQLite database file in a single pass, instead of one output 
+file per table. Used by `main(aggregate=True)`.
+
+Parameters:
+- tables (dict): Mapping of table name to DataFrame; entries that are None or have no columns are skipped.
+- output_filename (str): The name of the database file (default: `aggregate_filename`).
+- output_dir (str): The directory the database is written to (default: `output_directory`).
+
+Key Features:
+- Opens one connection and writes every table inside a single transaction, replacing tables of the same name.
+- Inserts rows in batches of `csv_chunk_rows`.
+
+Returns:
+- The path of the written database.
+"""
+def save_tables_to_database(tables, output_filename=None, output_dir=None):
+    output_filename = aggregate_filename if output_filename is None else output_filename
+    file_path = output_file_path(output_filename, output_dir)
+    with closing(sqlite3.connect(file_path)) as connection, connection:
+        for name, df in tables.items():
+            if df is None or df.columns.empty:
+                continue
+            df.to_sql(name, connection, index=False, if_exists="replace", chunksize=csv_chunk_rows)
+    return file_path
+
+"""
+Function: as_text_columns
+
+Purpose:
+Stores the given free-text columns as contiguous Arrow string arrays instead of one Python object per cell, 
+which cuts their memory use. `save_table` still writes them through `to_csv`, so the CSV output is unchanged.
+
+Parameters:
+- df (DataFrame): The table holding the text columns.
+- columns (list): The names of the columns to convert.
+
+Returns:
+- The DataFrame with the columns cast to `text_column_dtype`, or unchanged when pyarrow is not installed.
+"""
+def as_text_columns(df, columns):
+    if text_column_dtype is None:
+        return df
+    return df.astype({column: text_column_dtype for column in columns})
+
+"""
+Function: stream_table
+
+Purpose:
+Writes a table straight from its columns to a CSV file with `csv.writer`, without building a DataFrame 
+first. Rows are written in fixed-size chunks, so only one chunk of Python row objects exists at a time.
+
+Parameters:
+- columns (dict): Mapping of column name to an equal-length list or NumPy array, in output order.
+- output_filename (str): The name of the output CSV file.
+- chunk_size (int): The number of rows converted and written per batch (default: `csv_chunk_rows`).
+
+Key Features:
+- When `table_file_format` is "parquet", builds the DataFrame after all and hands it to `save_table`, since 
+  Parquet is written column by column rather than row by row.
+
+Returns:
+- The path of the written file.
+"""
+def stream_table(columns, output_filename, chunk_size=None):
+    if defer_table_writes:
+        return deferred_table_path(output_filename)
+    if table_file_format == "parquet":
+        return save_table(pd.DataFrame(columns, copy=False), output_filename)
+
+    chunk_size = csv_chunk_rows if chunk_size is None else chunk_size
+    num_rows = len(next(iter(columns.values()), []))
+    with open_output_file(output_filename, "w") as handle:
+        writer = csv.writer(handle, lineterminator=os.linesep)
+        writer.writerow(columns.keys())
+        for start in range(0, num_rows, chunk_size):
+            # NumPy slices convert straight to Python scalars; list slices are already lists
+            chunk = [column[start:start + chunk_size] for column in columns.values()]
+            chunk = [column.tolist() if isinstance(column, np.ndarray) else column for column in chunk]
+            writer.writerows(zip(*chunk))
+    return handle.name
+
+"""
+Function: sample_faker_pool
+
+Purpose:
+Fills a column with Faker output by calling the generator only for a small pool of distinct values and 
+sampling the column from that pool. Useful for free-text and date columns where exact per-row uniqueness 
+does not matter but Faker's per-call cost does.
+
+Parameters:
+- generator (callable): A zero-argument callable producing one value (e.g. `fake.text`).
+- num_values (int): The number of values to return.
+- pool_size (int): The maximum number of values actually generated (default: `faker_pool_size`).
+
+Returns:
+- A NumPy object array of length `num_values` drawn from the generated pool.
+"""
+def sample_faker_pool(generator, num_values, pool_size=None):
+    pool_size = faker_pool_size if pool_size is None else pool_size
+    pool = np.array([generator() for _ in range(min(num_values, pool_size))], dtype=object)
+    if len(pool) == 0:
+        return pool
+    return pool[rng.integers(0, len(pool), num_values)]
+
+"""
+Function: sample_covering_pairs
+
+Purpose:
+Samples distinct (row, column) index pairs for many-to-many link tables such as accommodation house rules 
+and accommodation amenities. Every row gets one random column first, and the remaining entries are drawn 
+without replacement from all unused pairs.
+
+Parameters:
+- num_rows (int): The number of rows (e.g. accommodations) that must each appear at least once.
+- num_columns (int): The number of columns (e.g. house rules or amenities) a row can be paired with.
+- total_entries (int): The total number of pairs to return; must not exceed `num_rows * num_columns`.
+
+Key Features:
+- Encodes each pair as `row * num_columns + column`, so uniqueness is a property of a single integer draw.
+- Fills one preallocated int64 code array in place, covering pairs first and extra pairs after them.
+- Draws the extra pairs with one `rng.choice(replace=False)` call over the unused codes.
+- Falls back to the `sample_unused_codes` bitset sampler when the pair space is larger than 
+  `pair_code_materialize_limit`, instead of enumerating it, and also for sparse draws (up to 
+  `sparse_pair_draw_fraction` of the free codes). The branch depends only on the sizes, never on whether 
+  Numba is installed, and both versions of the sampler draw the same codes, so a given seed yields the 
+  same pairs either way.
+
+Returns:
+- Two NumPy int64 arrays holding the row and column index of each pair; the covering pairs come first, 
+  in row order.
+"""
+def sample_covering_pairs(num_rows, num_columns, total_entries):
+    mandatory_count = min(num_rows, max(total_entries, 0))
+    remaining_entries = max(total_entries - mandatory_count, 0)
+    codes = np.empty(mandatory_count + remaining_entries, dtype=np.int64)
+
+    mandatory_codes = codes[:mandatory_count]
+    np.multiply(np.arange(mandatory_count), num_columns, out=mandatory_codes)
+    mandatory_codes += rng.integers(0, num_columns, size=mandatory_count)
+
+    num_codes = num_rows * num_columns
+    free_codes = num_codes - mandatory_count
+    use_bitset_kernel = (
+        num_codes > pair_code_materialize_limit or remaining_entries <= free_codes * sparse_pair_draw_fraction
+    )
+    if not use_bitset_kernel:
+        available_codes = np.setdiff1d(np.arange(num_codes), mandatory_codes, assume_unique=True)
+        codes[mandatory_count:] = rng.choice(available_codes, size=remaining_entries, replace=False)
+    else:
+        used_bits = np.zeros((num_codes + 63) // 64, dtype=np.uint64)
+        np.bitwise_or.at(
+            used_bits, mandatory_codes >> 6, np.left_shift(np.uint64(1), (mandatory_codes & 63).astype(np.uint64))
+        )
+        codes[mandatory_count:] = sample_unused_codes(rng, used_bits, num_codes, remaining_entries)
+
+    return np.divmod(codes, num_columns)
+
+"""
+Function: sample_unused_codes
+
+Purpose:
+Rejection-samples distinct codes in `[0, num_codes)` that are not yet set in a uint64 bitset, marking each 
+accepted code in the bitset. With Numba this is the compiled `_sample_unused_codes` kernel, which tests one 
+draw at a time. Without Numba a scalar Python loop would be slow, so the candidates are drawn and tested in 
+NumPy batches instead.
+
+Parameters:
+- generator (Generator): The NumPy generator to draw from (normally `rng`).
+- used_bits (ndarray): uint64 bitset over the code space; updated in place.
+- num_codes (int): The size of the code space.
+- num_samples (int): The number of codes to draw; must not exceed the number of unset codes.
+
+Key Features:
+- A batch of candidates consumes the same values as the kernel's one-at-a-time `generator.integers` calls, 
+  and a candidate is accepted when it is unused and not repeated earlier in the batch, exactly as the 
+  kernel would accept it.
+- After the last batch the generator is rewound and advanced to just past the last accepted draw, so it 
+  ends in the kernel's state and later draws are unaffected by how many extra candidates were drawn.
+
+Returns:
+- A NumPy int64 array of the accepted codes, in draw order.
+"""
+def sample_unused_codes(generator, used_bits, num_codes, num_samples):
+    if njit is not None:
+        return _sample_unused_codes(generator, used_bits, num_codes, num_samples)
+
+    codes = np.empty(num_samples, dtype=np.int64)
+    found = 0
+    while found < num_samples:
+        needed = num_samples - found
+        state = generator.bit_generator.state
+        candidates = generator.integers(0, num_codes, size=2 * needed)
+        bits = np.left_shift(np.uint64(1), (candidates & 63).astype(np.uint64))
+        first_draws = np.zeros(len(candidates), dtype=bool)
+        first_draws[np.unique(candidates, return_index=True)[1]] = True
+        accepted = np.flatnonzero(first_draws & ((used_bits[candidates >> 6] & bits) == 0))[:needed]
+
+        codes[found:found + len(accepted)] = candidates[accepted]
+        np.bitwise_or.at(used_bits, candidates[accepted] >> 6, bits[accepted])
+        found += len(accepted)
+        if found == num_samples:
+            generator.bit_generator.state = state
+            generator.integers(0, num_codes, size=accepted[-1] + 1)
+    return codes
+
+"""
+Function: describe_ids
+
+Purpose:
+Formats offending IDs for a validation message, listing at most `max_reported_ids` of them, so a badly 
+broken table cannot turn one message into a multi-megabyte string.
+
+Parameters:
+- ids (array-like): The offending IDs.
+
+Returns:
+- A string such as "[3, 7, 9]" or "[3, 7, 9] (and 120 more)".
+"""
+def describe_ids(ids):
+    ids = np.asarray(ids)
+    shown = ids[:max_reported_ids].tolist()
+    if len(ids) > len(shown):
+        return f"{shown} (and {len(ids) - len(shown)} more)"
+    return f"{shown}"
+
+"""
+Function: missing_id_mask
+
+Purpose:
+Flags the IDs of a foreign-key column that do not appear in the referenced ID column. Used by 
+`validate_tables` and `verify_data_integrity`.
+
+Parameters:
+- ids (Series): The foreign-key column to check (e.g. bookings' `GuestID`).
+- reference_ids (Series): The IDs the column may reference (e.g. the guests' `UserID`).
+
+Key Features:
+- Runs the compiled `_missing_id_mask` kernel, a single pass over a presence table, when Numba is installed 
+  and both columns are plain integer columns with IDs up to `id_lookup_table_limit`.
+- Falls back to `Series.isin` otherwise (no Numba, non-integer or very large IDs).
+
+Returns:
+- A NumPy boolean array, True where the ID is missing from `reference_ids`.
+"""
+def missing_id_mask(ids, reference_ids):
+    if (
+        njit is not None
+        and all(isinstance(column.dtype, np.dtype) and column.dtype.kind in "iu" for column in (ids, reference_ids))
+        and (reference_ids.empty or reference_ids.max() <= id_lookup_table_limit)
+    ):
+        return _missing_id_mask(ids.to_numpy(dtype=np.int64), reference_ids.to_numpy(dtype=np.int64))
+    return ~ids.isin(reference_ids).to_numpy()
 
 """
 Function: populate_user_table
@@ -21,7 +676,8 @@ Generates a synthetic dataset for the "users" table, ensuring a proportional dis
 email, address, and user type, and saves the data to a CSV file.
 
 Parameters:
-- num_users (int): The desired number of users to generate (default: 100).
+- num_users (int): The desired number of users to generate (default: 400, which gives 100 hosts, enough for 
+  the default 50 accommodations).
 - output_filename (str): The name of the output CSV file (default: "users.csv").
 - min_admins (int): The minimum number of admins to include in the dataset (default: 20).
 
@@ -29,75 +685,73 @@ Key Features:
 - Ensures admins are at least 5% of the total users or `min_admins`, whichever is higher.
 - At least 25% of users are hosts, with the remaining users assigned as guests.
 - Generates realistic data using the `faker` library for attributes like name, email, and address.
+- Samples the shared columns (address city and country, registration and last-login dates) from Faker pools 
+  via `sample_faker_pool`; identifying fields such as names, emails and passwords are still drawn per user.
 - Saves the generated data to a CSV file.
 
 Returns:
 - A pandas DataFrame containing the generated user data.
 - Returns an empty DataFrame with appropriate columns in case of an error.
 """
-def populate_user_table(num_users=100, output_filename="users.csv", min_admins=20):
+def populate_user_table(num_users=400, output_filename="users.csv", min_admins=20):
     try:
-        min_users_needed = max(num_users, min_admins * 20)
-        total_users = max(min_users_needed, num_users)
+        total_users = num_users
 
-        num_admins = min_admins
+        num_admins = max(min_admins, int(total_users * 0.05))
         num_hosts = max(5, int(total_users * 0.25)) 
         num_guests = total_users - (num_admins + num_hosts)
+        if num_guests < 0:
+            raise ValueError(f"num_users ({num_users}) is too small for {num_admins} admins and {num_hosts} hosts.")
 
         print(f"Generating {total_users} users: {num_guests} guests, {num_hosts} hosts, {num_admins} admins.")
 
         email_providers = ['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com', 'icloud.com']
-        users = []
-        guest_count = 0
-        host_count = 0
-        admin_count = 0
-
-        for user_id in range(1, total_users + 1):
-            name = fake.name()
-            local_part = fake.user_name()
-            domain = random.choice(email_providers)
-            email = f"{local_part}@{domain}"
-            password = fake.password()
-            phone = re.sub(r'\D', '', fake.phone_number()) if fake.boolean(chance_of_getting_true=90) else None
-            date_of_birth = fake.date_of_birth(minimum_age=18, maximum_age=75)
-            gender = random.choice(['Male', 'Female', 'Other']) if fake.boolean(chance_of_getting_true=95) else None
-            address = fake.street_address() + ", " + fake.city() + ", " + fake.country()
-            registration_date = fake.date_this_decade()
-            last_login = fake.date_time_this_year() if fake.boolean(chance_of_getting_true=85) else None
-            user_status = random.choice(['active', 'inactive'])
-
-            if admin_count < num_admins:
-                user_type = 'admin'
-                admin_count += 1
-            elif host_count < num_hosts:
-                user_type = 'host'
-                host_count += 1
-            else:
-                user_type = 'guest'
-                guest_count += 1
-
-            users.append({
-                "UserID": user_id,
-                "Name": name,
-                "Email": email,
-                "Password": password,
-                "Phone": phone,
-                "UserType": user_type,
-                "DateOfBirth": date_of_birth,
-                "Gender": gender,
-                "Address": address,
-                "RegistrationDate": registration_date,
-                "LastLogin": last_login,
-                "UserStatus": user_status
-            })
-
-        assert admin_count >= min_admins, "Insufficient admins generated."
-        assert host_count + guest_count + admin_count == total_users, "Role counts do not add up."
 
-        df_users = pd.DataFrame(users)
+        has_phone = rng.random(total_users) < 0.9
+        has_gender = rng.random(total_users) < 0.95
+        has_last_login = rng.random(total_users) < 0.85
+
+        names = [_fake_name() for _ in range(total_users)]
+        emails = [f"{_fake_user_name()}@{domain}" for domain in rng.choice(email_providers, total_users)]
+        passwords = [_fake_password() for _ in range(total_users)]
+        phones = [_NON_DIGIT.sub('', _fake_phone()) if keep else None for keep in has_phone]
+        dates_of_birth = [_fake_dob(minimum_age=18, maximum_age=75) for _ in range(total_users)]
+        gender_options = ['Male', 'Female', 'Other']
+        user_status_options = ['active', 'inactive']
+        genders = np.where(has_gender, rng.choice(gender_options, total_users), None)
+        streets = [_fake_street() for _ in range(total_users)]
+        user_cities = sample_faker_pool(_fake_city, total_users)
+        user_countries = sample_faker_pool(_fake_country, total_users)
+        addresses = [f"{street}, {city}, {country}" for street, city, country in zip(streets, user_cities, user_countries)]
+        registration_dates = sample_faker_pool(_fake_date_decade, total_users)
+        last_logins = np.where(has_last_login, sample_faker_pool(_fake_dt_year, total_users), None)
+        user_statuses = rng.choice(user_status_options, total_users)
+        user_types = np.array(['admin'] * num_admins + ['host'] * num_hosts + ['guest'] * num_guests)
+
+        admin_count = int((user_types == 'admin').sum())
+        host_count = int((user_types == 'host').sum())
+        guest_count = int((user_types == 'guest').sum())
+
+        assert admin_count >= num_admins, "Insufficient admins generated."
+        assert host_count + guest_count + admin_count == total_users, "Role counts do not add up."
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_users.to_csv(file_path, index=False)
+        df_users = pd.DataFrame({
+            "UserID": np.arange(1, total_users + 1, dtype=np.int64),
+            "Name": names,
+            "Email": emails,
+            "Password": passwords,
+            "Phone": phones,
+            "UserType": pd.Categorical(user_types, categories=["admin", "host", "guest"]),
+            "DateOfBirth": dates_of_birth,
+            "Gender": pd.Categorical(genders, categories=gender_options),
+            "Address": addresses,
+            "RegistrationDate": registration_dates,
+            "LastLogin": last_logins,
+            "UserStatus": pd.Categorical(user_statuses, categories=user_status_options)
+        }, copy=False)
+        df_users = as_text_columns(df_users, ["Name", "Email", "Password", "Phone", "Address"])
+
+        file_path = save_table(df_users, output_filename)
         print(f"User table data saved to: {file_path}")
 
         return df_users
@@ -109,6 +763,22 @@ def populate_user_table(num_users=100, output_filename="users.csv", min_admins=2
             "RegistrationDate", "LastLogin", "UserStatus"
         ])
 
+"""
+Function: build_user_type_index
+
+Purpose:
+Groups the UserIDs of the users table by user type in a single pass, so generators that only need the 
+hosts or the guests can receive them directly instead of re-filtering the whole users table.
+
+Parameters:
+- df_users (DataFrame): DataFrame containing user data with `UserID` and `UserType` columns.
+
+Returns:
+- A dictionary mapping each user type ("admin", "host", "guest") to a NumPy array of its UserIDs.
+"""
+def build_user_type_index(df_users):
+    return df_users.groupby("UserType", observed=True)["UserID"].apply(lambda ids: ids.to_numpy(dtype=np.int64)).to_dict()
+
 """
 Function: populate_country_table
 
@@ -135,17 +805,16 @@ def populate_country_table(output_filename="countries.csv", num_countries=20):
         country_prefixes = ["New", "Old", "North", "South", "East", "West", "Great", "United", "Republic of"]
         country_suffixes = ["land", "stan", "ia", "nia", "lia", "rica", "esia", "dor", "ovia", "burg"]
 
-        countries = []
-        for i in range(num_countries):
-            prefix = random.choice(country_prefixes)
-            suffix = random.choice(country_suffixes)
-            country_name = f"{prefix} {suffix}"
-            countries.append({"CountryID": i + 1, "CountryName": country_name})
+        prefixes = rng.choice(country_prefixes, num_countries)
+        suffixes = rng.choice(country_suffixes, num_countries)
+        country_names = [f"{prefix} {suffix}" for prefix, suffix in zip(prefixes, suffixes)]
 
-        df_countries = pd.DataFrame(countries)
+        df_countries = pd.DataFrame({
+            "CountryID": np.arange(1, num_countries + 1, dtype=np.int64),
+            "CountryName": country_names
+        }, copy=False)
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_countries.to_csv(file_path, index=False)
+        file_path = save_table(df_countries, output_filename)
         print(f"Country data successfully saved to: {file_path}")
 
         return df_countries
@@ -191,35 +860,25 @@ def populate_city_table(df_countries, output_filename="cities.csv", num_cities=N
             print(f"Adjusted num_cities to meet the minimum requirement: {num_cities}")
 
         city_suffixes = ["ville", "town", "burg", " City", "side", "port", "field", "bridge"]
-        cities = []
-        city_id = 1
-
-        for _, country in df_countries.iterrows():
-            for _ in range(3):  
-                city_name = fake.first_name() + random.choice(city_suffixes)
-                cities.append({
-                    "CityID": city_id,
-                    "CountryID": country["CountryID"],
-                    "CityName": city_name
-                })
-                city_id += 1
-
-        remaining_cities = num_cities - len(cities)
-        while remaining_cities > 0:
-            random_country = df_countries.sample(1).iloc[0]
-            city_name = fake.first_name() + random.choice(city_suffixes)
-            cities.append({
-                "CityID": city_id,
-                "CountryID": random_country["CountryID"],
-                "CityName": city_name
-            })
-            city_id += 1
-            remaining_cities -= 1
-
-        df_cities = pd.DataFrame(cities)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_cities.to_csv(file_path, index=False)
+        # bounded pool of first names, so Faker is called at most city_name_pool_size times per table
+        first_name_pool = [_fake_first_name() for _ in range(min(num_cities, city_name_pool_size))]
+        first_names = rng.choice(first_name_pool, num_cities)
+        suffixes = rng.choice(city_suffixes, num_cities)
+        city_names = [first_name + suffix for first_name, suffix in zip(first_names, suffixes)]
+
+        country_ids = df_countries["CountryID"].to_numpy(dtype=np.int64)
+        city_country_ids = np.concatenate([
+            np.repeat(country_ids, 3),
+            rng.choice(country_ids, size=num_cities - min_cities_required)
+        ])
+
+        df_cities = pd.DataFrame({
+            "CityID": np.arange(1, len(city_names) + 1, dtype=np.int64),
+            "CountryID": city_country_ids,
+            "CityName": city_names
+        }, copy=False)
+
+        file_path = save_table(df_cities, output_filename)
         print(f"City data successfully saved to: {file_path}")
 
         return df_cities
@@ -242,75 +901,79 @@ Parameters:
 - countries_df (DataFrame): DataFrame containing country data, used to assign CountryIDs to accommodations.
 - output_filename (str): The name of the output CSV file (default: "accommodations.csv").
 - num_accommodations (int): The total number of accommodations to generate (default: 50).
+- valid_hosts (array-like, optional): Precomputed host UserIDs (e.g. from `build_user_type_index`). 
+  Derived from `users_df` when not provided.
 
 Key Features:
 - Ensures accommodations are linked to valid hosts from the user data.
 - Associates each accommodation with a valid city and country.
 - Generates diverse property types, pricing, availability, and ratings.
+- Samples neighborhoods and registration/update dates from Faker pools via `sample_faker_pool`.
 - Handles validation for missing or empty data in the inputs.
 
 Returns:
 - A pandas DataFrame containing the generated accommodation data.
 - Returns an empty DataFrame with appropriate columns in case of validation or unexpected errors.
 """
-def populate_accommodation_table(users_df, cities_df, countries_df, output_filename="accommodations.csv", num_accommodations=50):
+def populate_accommodation_table(users_df, cities_df, countries_df, output_filename="accommodations.csv", num_accommodations=50,
+                                 valid_hosts=None):
     try:
-        valid_hosts = users_df[users_df["UserType"] == "host"]["UserID"].tolist()
-        if not valid_hosts:
+        if valid_hosts is None:
+            valid_hosts = users_df.loc[users_df["UserType"] == "host", "UserID"].to_numpy(dtype=np.int64)
+        if len(valid_hosts) == 0:
             raise ValueError("No valid hosts found in Users table. Cannot populate Accommodations table.")
 
-        city_ids = cities_df["CityID"].tolist()
-        country_ids = countries_df["CountryID"].tolist()
-        if not city_ids or not country_ids:
+        city_ids = cities_df["CityID"].to_numpy(dtype=np.int64)
+        country_ids = countries_df["CountryID"].to_numpy(dtype=np.int64)
+        if not len(city_ids) or not len(country_ids):
             raise ValueError("City or Country table is empty. Cannot assign CityID or CountryID.")
 
         property_types = ["apartment", "house", "studio", "villa", "boathouse", "cabin"]
-        accommodations = []
-
-        for accommodation_id in range(1, num_accommodations + 1):
-            host_id = random.choice(valid_hosts)
-            title = f"Accommodation {accommodation_id}"
-            description = fake.text(max_nb_chars=200)
-            address = fake.street_address()
-            city_id = random.choice(city_ids)
-            country_id = random.choice(country_ids)
-            price_per_night = round(random.uniform(50, 500), 2)
-            availability_status = random.choice(['available', 'unavailable'])
-            property_type = random.choice(property_types)
-            num_bedrooms = random.randint(1, 5)
-            num_bathrooms = random.randint(1, 3)
-            square_footage = random.randint(300, 3000)
-            neighborhood = fake.city() if fake.boolean(chance_of_getting_true=70) else None
-            host_rating = round(random.uniform(2.5, 5.0), 1)
-            accommodation_rating = round(random.uniform(2.5, 5.0), 1)
-            registration_date = fake.date_this_decade()
-            last_updated = fake.date_time_this_year()
-
-            accommodations.append({
-                "AccommodationID": accommodation_id,
-                "HostID": host_id,
-                "Title": title,
-                "Description": description,
-                "Address": address,
-                "CityID": city_id,
-                "CountryID": country_id,
-                "PricePerNight": price_per_night,
-                "AvailabilityStatus": availability_status,
-                "PropertyType": property_type,
-                "NumberOfBedrooms": num_bedrooms,
-                "NumberOfBathrooms": num_bathrooms,
-                "SquareFootage": square_footage,
-                "Neighborhood": neighborhood,
-                "HostRating": host_rating,
-                "AccommodationRating": accommodation_rating,
-                "RegistrationDate": registration_date,
-                "LastUpdated": last_updated
-            })
-
-        accommodations_df = pd.DataFrame(accommodations)
-
-        file_path = os.path.join(output_directory, output_filename)
-        accommodations_df.to_csv(file_path, index=False)
+        host_ids = rng.choice(valid_hosts, num_accommodations)
+        accommodation_city_ids = rng.choice(city_ids, num_accommodations)
+        accommodation_country_ids = rng.choice(country_ids, num_accommodations)
+        prices_per_night = np.round(rng.uniform(50, 500, num_accommodations), 2)
+        availability_options = ['available', 'unavailable']
+        availability_statuses = rng.choice(availability_options, num_accommodations)
+        accommodation_property_types = rng.choice(property_types, num_accommodations)
+        num_bedrooms = rng.integers(1, 6, num_accommodations)
+        num_bathrooms = rng.integers(1, 4, num_accommodations)
+        square_footages = rng.integers(300, 3001, num_accommodations)
+        host_ratings = np.round(rng.uniform(2.5, 5.0, num_accommodations), 1)
+        accommodation_ratings = np.round(rng.uniform(2.5, 5.0, num_accommodations), 1)
+        has_neighborhood = rng.random(num_accommodations) < 0.7
+
+        descriptions = [_fake_text(max_nb_chars=200) for _ in range(num_accommodations)]
+        addresses = [_fake_street() for _ in range(num_accommodations)]
+        neighborhoods = np.where(has_neighborhood, sample_faker_pool(_fake_city, num_accommodations), None)
+        registration_dates = sample_faker_pool(_fake_date_decade, num_accommodations)
+        last_updated = sample_faker_pool(_fake_dt_year, num_accommodations)
+
+        accommodation_ids = np.arange(1, num_accommodations + 1, dtype=np.int64)
+
+        accommodations_df = pd.DataFrame({
+            "AccommodationID": accommodation_ids,
+            "HostID": host_ids,
+            "Title": [f"Accommodation {accommodation_id}" for accommodation_id in accommodation_ids],
+            "Description": descriptions,
+            "Address": addresses,
+            "CityID": accommodation_city_ids,
+            "CountryID": accommodation_country_ids,
+            "PricePerNight": prices_per_night,
+            "AvailabilityStatus": pd.Categorical(availability_statuses, categories=availability_options),
+            "PropertyType": pd.Categorical(accommodation_property_types, categories=property_types),
+            "NumberOfBedrooms": num_bedrooms,
+            "NumberOfBathrooms": num_bathrooms,
+            "SquareFootage": square_footages,
+            "Neighborhood": neighborhoods,
+            "HostRating": host_ratings,
+            "AccommodationRating": accommodation_ratings,
+            "RegistrationDate": registration_dates,
+            "LastUpdated": last_updated
+        }, copy=False)
+        accommodations_df = as_text_columns(accommodations_df, ["Title", "Description", "Address", "Neighborhood"])
+
+        file_path = save_table(accommodations_df, output_filename)
         print(f"Accommodation table data successfully saved to: {file_path}")
 
         return accommodations_df
@@ -349,6 +1012,8 @@ Parameters:
 - max_bookings_per_guest (int): Maximum number of bookings a single guest can make (default: 3).
 - max_total_bookings_multiplier (float): Multiplier to limit the total number of bookings based on 
   the number of guests (default: 1.5).
+- guest_ids (array-like, optional): Precomputed guest UserIDs (e.g. from `build_user_type_index`). 
+  Derived from `df_users` when not provided.
 
 Key Features:
 - Ensures only guests from the users table can create bookings.
@@ -356,6 +1021,8 @@ Key Features:
   and payment/booking statuses.
 - Limits total bookings to avoid oversaturation and ensures bookings fit within the given timeframe.
 - Supports flexible guest booking limits and total booking thresholds.
+- Stores BookingStatus and PaymentStatus as categoricals, so the status filters in downstream tables 
+  compare integer codes instead of strings.
 
 Returns:
 - A pandas DataFrame containing the generated booking data.
@@ -366,65 +1033,70 @@ def populate_booking_table(
     df_accommodations, 
     output_filename="bookings.csv", 
     max_bookings_per_guest=3, 
-    max_total_bookings_multiplier=1.5
+    max_total_bookings_multiplier=1.5,
+    guest_ids=None
 ):
     try:
-        guests = df_users[df_users["UserType"] == "guest"]
-        if guests.empty:
+        if guest_ids is None:
+            guest_ids = df_users.loc[df_users["UserType"] == "guest", "UserID"].to_numpy(dtype=np.int64)
+        if len(guest_ids) == 0:
             raise ValueError("No guests found. Cannot create bookings.")
 
-        total_guests = len(guests)
+        total_guests = len(guest_ids)
         max_total_bookings = int(total_guests * max_total_bookings_multiplier)
 
-        bookings = []
         start_date = date(2024, 6, 1)  
         end_date = date(2024, 6, 30)  
-        booking_id = 1
-
-        for _, guest in guests.iterrows():
-            num_bookings = random.randint(1, max_bookings_per_guest)
-            for _ in range(num_bookings):
-                if len(bookings) >= max_total_bookings:
-                    break
-
-                if random.random() > 0.3:  
-                    accommodation = df_accommodations.sample(1).iloc[0]
-                    accommodation_id = accommodation["AccommodationID"]
-                    price_per_night = accommodation["PricePerNight"]
-
-                    check_in_date = fake.date_between(start_date=start_date, end_date=end_date)
-                    max_checkout_date = min(check_in_date + timedelta(days=7), end_date)
-                    check_out_date = fake.date_between(start_date=check_in_date, end_date=max_checkout_date)
-
-                    num_nights = (check_out_date - check_in_date).days
-                    if num_nights <= 0:
-                        continue
-
-                    base_amount = num_nights * price_per_night
-                    discount = round(random.uniform(0, 20), 2) if random.random() < 0.8 else 0
-                    total_amount = round(base_amount - (base_amount * (discount / 100)), 2)
-
-                    booking_status = random.choices(['confirmed', 'cancelled', 'pending'], weights=[60, 20, 20], k=1)[0]
-                    payment_status = random.choice(['paid', 'unpaid', 'failed'])
-
-                    bookings.append({
-                        "BookingID": booking_id,
-                        "GuestID": guest["UserID"],
-                        "AccommodationID": accommodation_id,
-                        "CheckInDate": check_in_date,
-                        "CheckOutDate": check_out_date,
-                        "TotalAmount": total_amount,
-                        "BookingStatus": booking_status,
-                        "DiscountApplied": discount,
-                        "PaymentStatus": payment_status,
-                        "CreatedAt": pd.Timestamp.now(),
-                        "UpdatedAt": pd.Timestamp.now()
-                    })
-                    booking_id += 1
-
-        df_bookings = pd.DataFrame(bookings)
-        file_path = os.path.join(output_directory, output_filename)
-        df_bookings.to_csv(file_path, index=False)
+
+        max_possible_bookings = total_guests * max_bookings_per_guest
+        accommodation_ids = df_accommodations["AccommodationID"].to_numpy(dtype=np.int64)
+        prices_per_night = df_accommodations["PricePerNight"].to_numpy(dtype=np.float64)
+        accommodation_draws = rng.integers(0, len(accommodation_ids), size=max_possible_bookings)
+        booking_draws = rng.random(max_possible_bookings)
+        discount_draws = rng.random(max_possible_bookings)
+        discount_rates = np.round(rng.uniform(0, 20, max_possible_bookings), 2)
+        bookings_per_guest = rng.integers(1, max_bookings_per_guest + 1, size=total_guests)
+
+        period_days = (end_date - start_date).days
+        check_in_offsets = rng.integers(0, period_days + 1, size=max_possible_bookings)
+        check_out_offsets = rng.integers(check_in_offsets, np.minimum(check_in_offsets + 7, period_days) + 1)
+        nights = check_out_offsets - check_in_offsets
+        booking_statuses = ['confirmed', 'cancelled', 'pending']
+        payment_statuses = ['paid', 'unpaid', 'failed']
+        booking_status_draws = rng.choice(booking_statuses, size=max_possible_bookings, p=[0.6, 0.2, 0.2])
+        payment_status_draws = rng.choice(payment_statuses, size=max_possible_bookings)
+
+        # one attempt per (guest, requested booking); drop the 30% skipped and zero-night attempts,
+        # then keep the first max_total_bookings in guest order
+        attempt_guest_ids = np.repeat(guest_ids, bookings_per_guest)
+        num_attempts = len(attempt_guest_ids)
+        booked = (booking_draws[:num_attempts] > 0.3) & (nights[:num_attempts] > 0)
+        k = np.flatnonzero(booked)[:max_total_bookings]
+
+        acc_idx = accommodation_draws[k]
+        discounts = np.where(discount_draws[k] < 0.8, discount_rates[k], 0.0)
+        total_amounts = _compute_booking_totals(nights[k], prices_per_night[acc_idx], discounts)
+
+        period_start = np.datetime64(start_date)
+        check_in_dates = (period_start + check_in_offsets[k].astype("timedelta64[D]")).astype(object)
+        check_out_dates = (period_start + check_out_offsets[k].astype("timedelta64[D]")).astype(object)
+
+        created_at = pd.Timestamp.now()
+
+        df_bookings = pd.DataFrame({
+            "BookingID": np.arange(1, len(k) + 1, dtype=np.int64),
+            "GuestID": attempt_guest_ids[k],
+            "AccommodationID": accommodation_ids[acc_idx],
+            "CheckInDate": check_in_dates,
+            "CheckOutDate": check_out_dates,
+            "TotalAmount": total_amounts,
+            "BookingStatus": pd.Categorical(booking_status_draws[k], categories=booking_statuses),
+            "DiscountApplied": discounts,
+            "PaymentStatus": pd.Categorical(payment_status_draws[k], categories=payment_statuses),
+            "CreatedAt": created_at,
+            "UpdatedAt": created_at
+        }, copy=False)
+        file_path = save_table(df_bookings, output_filename)
         print(f"Booking table data successfully saved to: {file_path}")
 
         return df_bookings
@@ -466,9 +1138,10 @@ def populate_cancellation_table(df_bookings, output_filename="cancellations.csv"
         if len(cancelled_bookings) < min_cancellations:
             additional_cancellations_needed = min_cancellations - len(cancelled_bookings)
             eligible_bookings = df_bookings[df_bookings["BookingStatus"] != "cancelled"]
-            additional_bookings = eligible_bookings.sample(
-                min(additional_cancellations_needed, len(eligible_bookings))
+            additional_positions = rng.choice(
+                len(eligible_bookings), min(additional_cancellations_needed, len(eligible_bookings)), replace=False
             )
+            additional_bookings = eligible_bookings.iloc[additional_positions]
             cancelled_bookings = pd.concat([cancelled_bookings, additional_bookings])
 
         cancellation_reasons = [
@@ -484,26 +1157,20 @@ def populate_cancellation_table(df_bookings, output_filename="cancellations.csv"
             "Host unresponsive or uncooperative"
         ]
 
-        cancellations = []
-        for _, booking in cancelled_bookings.iterrows():
-            booking_id = booking["BookingID"]
-            check_in_date = pd.to_datetime(booking["CheckInDate"]).date()
-
-            start_date = pd.to_datetime("2024-01-01").date()
-            end_date = check_in_date - timedelta(days=1)
-            cancellation_date = fake.date_between(start_date=start_date, end_date=end_date).isoformat()
-            cancellation_reason = random.choice(cancellation_reasons)
+        start_date = np.datetime64("2024-01-01")
+        check_in_dates = pd.to_datetime(cancelled_bookings["CheckInDate"]).dt.normalize().to_numpy().astype("datetime64[D]")
+        # cancellation falls between start_date and the day before check-in, inclusive
+        window_days = (check_in_dates - start_date).astype(np.int64)
+        offsets = rng.integers(0, window_days)
+        cancellation_dates = np.datetime_as_string(start_date + offsets.astype("timedelta64[D]"), unit="D")
 
-            cancellations.append({
-                "BookingID": booking_id,
-                "CancellationDate": cancellation_date,
-                "CancellationReason": cancellation_reason
-            })
+        df_cancellations = pd.DataFrame({
+            "BookingID": cancelled_bookings["BookingID"].to_numpy(dtype=np.int64),
+            "CancellationDate": cancellation_dates,
+            "CancellationReason": rng.choice(cancellation_reasons, size=len(cancelled_bookings))
+        }, copy=False)
 
-        df_cancellations = pd.DataFrame(cancellations)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_cancellations.to_csv(file_path, index=False)
+        file_path = save_table(df_cancellations, output_filename)
         print(f"Cancellation table data successfully saved to: {file_path}")
 
         return df_cancellations
@@ -528,6 +1195,8 @@ Parameters:
 - df_accommodations (DataFrame): DataFrame containing accommodation data, used to identify accommodations.
 - df_bookings (DataFrame): DataFrame containing booking data, used to determine availability.
 - output_filename (str): The name of the output CSV file (default: "availability.csv").
+- output_format (str): "csv" (default) saves via a DataFrame; "csv_stream" writes the rows straight 
+  from the availability matrix with `stream_table` and skips building the DataFrame.
 
 Key Features:
 - Initializes all dates within the specified period as available for each accommodation.
@@ -535,50 +1204,51 @@ Key Features:
 - Creates a comprehensive record of availability status for all accommodations over the period.
 
 Returns:
-- A pandas DataFrame containing the generated availability data.
+- A pandas DataFrame containing the generated availability data, or None when `output_format` is "csv_stream".
 - Returns an empty DataFrame with appropriate columns in case of validation or unexpected errors.
 """
-def populate_availability_table(df_accommodations, df_bookings, output_filename="availability.csv"):
+def populate_availability_table(df_accommodations, df_bookings, output_filename="availability.csv", output_format="csv"):
     try:
         if df_accommodations.empty:
             raise ValueError("The accommodations DataFrame is empty. Cannot generate availability data.")
         if df_bookings.empty:
             raise ValueError("The bookings DataFrame is empty. Cannot generate availability data.")
 
-        availability = []
         start_date = date(2024, 6, 1)
         end_date = date(2024, 6, 30)
+        num_days = (end_date - start_date).days + 1
 
-        for _, accommodation in df_accommodations.iterrows():
-            accommodation_id = accommodation["AccommodationID"]
+        accommodation_ids = df_accommodations["AccommodationID"].to_numpy(dtype=np.int64)
+        acc_index = {accommodation_id: i for i, accommodation_id in enumerate(accommodation_ids)}
+        availability_matrix = np.ones((len(accommodation_ids), num_days), dtype=bool)
 
-            availability_dates = {start_date + timedelta(days=i): True for i in range((end_date - start_date).days + 1)}
+        confirmed_bookings = df_bookings[
+            (df_bookings["BookingStatus"] == "confirmed") &
+            (df_bookings["AccommodationID"].isin(acc_index))
+        ]
+        period_start = pd.Timestamp(start_date)
+        check_in_offsets = (pd.to_datetime(confirmed_bookings["CheckInDate"]) - period_start).dt.days.clip(0, num_days).to_numpy()
+        check_out_offsets = (pd.to_datetime(confirmed_bookings["CheckOutDate"]) - period_start).dt.days.clip(0, num_days).to_numpy()
+        row_indices = confirmed_bookings["AccommodationID"].map(acc_index).to_numpy(dtype=np.int64)
 
-            confirmed_bookings = df_bookings[
-                (df_bookings["AccommodationID"] == accommodation_id) &
-                (df_bookings["BookingStatus"] == "confirmed")
-            ]
+        _mark_unavailable(availability_matrix, row_indices, check_in_offsets, check_out_offsets)
 
-            for _, booking in confirmed_bookings.iterrows():
-                check_in_date = pd.to_datetime(booking["CheckInDate"]).date()
-                check_out_date = pd.to_datetime(booking["CheckOutDate"]).date()
+        date_strings = [(start_date + timedelta(days=i)).isoformat() for i in range(num_days)]
 
-                for d in range((check_out_date - check_in_date).days):
-                    date_to_mark = check_in_date + timedelta(days=d)
-                    if date_to_mark in availability_dates:
-                        availability_dates[date_to_mark] = False
+        availability_columns = {
+            "AccommodationID": np.repeat(accommodation_ids, num_days),
+            "Date": np.tile(date_strings, len(accommodation_ids)),
+            "IsAvailable": availability_matrix.ravel()
+        }
 
-            for availability_date, is_available in availability_dates.items():
-                availability.append({
-                    "AccommodationID": accommodation_id,
-                    "Date": availability_date.isoformat(),
-                    "IsAvailable": is_available
-                })
+        if output_format == "csv_stream":
+            file_path = stream_table(availability_columns, output_filename)
+            print(f"Availability table data successfully saved to: {file_path}")
+            return None
 
-        df_availability = pd.DataFrame(availability)
+        df_availability = pd.DataFrame(availability_columns, copy=False)
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_availability.to_csv(file_path, index=False)
+        file_path = save_table(df_availability, output_filename)
         print(f"Availability table data successfully saved to: {file_path}")
 
         return df_availability
@@ -602,59 +1272,57 @@ Parameters:
 - df_accommodations (DataFrame): DataFrame containing accommodation data, used to assign photos.
 - total_photos (int): The total number of photos to generate across all accommodations (default: 255).
 - output_filename (str): The name of the output CSV file (default: "photos.csv").
+- output_format (str): "csv" (default) saves via a DataFrame; "csv_stream" writes the rows straight 
+  from the generated columns with `stream_table` and skips building the DataFrame.
 
 Key Features:
 - Ensures each accommodation receives at least one photo.
 - Distributes additional photos randomly among accommodations until the total photo count is met.
-- Generates realistic photo URLs using a fake data generator.
+- Generates realistic photo URLs using a fake data generator, sampled from a pool via `sample_faker_pool`.
 - Validates the input DataFrame to ensure it contains accommodations and an 'AccommodationID' column.
 
 Returns:
-- A pandas DataFrame containing the generated photo data.
+- A pandas DataFrame containing the generated photo data, or None when `output_format` is "csv_stream".
 - Returns an empty DataFrame with appropriate columns in case of validation or unexpected errors.
 """
-def populate_photo_table(df_accommodations, total_photos=255, output_filename="photos.csv"):
+def populate_photo_table(df_accommodations, total_photos=255, output_filename="photos.csv", output_format="csv"):
     try:
         if df_accommodations.empty:
             raise ValueError("The accommodations DataFrame is empty. Cannot generate photos.")
         if "AccommodationID" not in df_accommodations.columns:
             raise ValueError("The accommodations DataFrame must include an 'AccommodationID' column.")
 
-        photos = []
-        photo_id = 1
-        accommodation_ids = df_accommodations["AccommodationID"].tolist()
+        accommodation_ids = df_accommodations["AccommodationID"].to_numpy(dtype=np.int64)
 
         min_photos = 1
 
-        for accommodation_id in accommodation_ids:
-            num_photos = random.randint(min_photos, min(10, total_photos))
-            for _ in range(num_photos):
-                photos.append({
-                    "PhotoID": photo_id,
-                    "AccommodationID": accommodation_id,
-                    "PhotoURL": fake.image_url()
-                })
-                photo_id += 1
-
-            total_photos -= num_photos
-
-            if total_photos <= 0:
-                break
-
-        while total_photos > 0:
-            random_accommodation = random.choice(accommodation_ids)
-            photos.append({
-                "PhotoID": photo_id,
-                "AccommodationID": random_accommodation,
-                "PhotoURL": fake.image_url()
-            })
-            photo_id += 1
-            total_photos -= 1
-
-        df_photos = pd.DataFrame(photos)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_photos.to_csv(file_path, index=False)
+        photos_per_accommodation = rng.integers(min_photos, min(10, total_photos) + 1, size=len(accommodation_ids))
+        cumulative_photos = np.cumsum(photos_per_accommodation)
+        if cumulative_photos[-1] >= total_photos:
+            last = int(np.searchsorted(cumulative_photos, total_photos))
+            photos_per_accommodation = photos_per_accommodation[:last + 1]
+            photos_per_accommodation[-1] -= cumulative_photos[last] - total_photos
+
+        photo_accommodation_ids = np.concatenate([
+            np.repeat(accommodation_ids[:len(photos_per_accommodation)], photos_per_accommodation),
+            rng.choice(accommodation_ids, size=total_photos - photos_per_accommodation.sum())
+        ])
+        photo_urls = sample_faker_pool(_fake_image_url, len(photo_accommodation_ids))
+
+        photo_columns = {
+            "PhotoID": np.arange(1, len(photo_urls) + 1, dtype=np.int64),
+            "AccommodationID": photo_accommodation_ids,
+            "PhotoURL": photo_urls
+        }
+
+        if output_format == "csv_stream":
+            file_path = stream_table(photo_columns, output_filename)
+            print(f"Photo table data successfully saved to: {file_path}")
+            return None
+
+        df_photos = pd.DataFrame(photo_columns, copy=False)
+
+        file_path = save_table(df_photos, output_filename)
         print(f"Photo table data successfully saved to: {file_path}")
 
         return df_photos
@@ -679,6 +1347,9 @@ Parameters:
 - min_messages (int): The minimum number of messages to generate (default: 20).
 - scaling_factor (int): Multiplier to scale the number of messages relative to the number of users (default: 2).
 - output_filename (str): The name of the output CSV file (default: "messages.csv").
+- output_format (str): "csv" (default) saves via a single DataFrame; "csv_stream" generates and appends the 
+  messages `chunk_size` rows at a time, so memory stays bounded by one chunk.
+- chunk_size (int): The number of messages generated per chunk in "csv_stream" mode (default: 100000).
 
 Key Features:
 - Ensures a minimum number of messages is generated, scaled by the number of users.
@@ -687,42 +1358,51 @@ Key Features:
 - Validates the input DataFrame to ensure it contains user data and at least two users.
 
 Returns:
-- A pandas DataFrame containing the generated message data.
+- A pandas DataFrame containing the generated message data, or None when `output_format` is "csv_stream".
 - Returns an empty DataFrame with appropriate columns in case of validation or unexpected errors.
 """
-def populate_message_table(df_users, min_messages=20, scaling_factor=2, output_filename="messages.csv"):
+def populate_message_table(df_users, min_messages=20, scaling_factor=2, output_filename="messages.csv",
+                           output_format="csv", chunk_size=100_000):
     try:
         if df_users.empty:
             raise ValueError("The users DataFrame is empty. Cannot generate messages.")
         if "UserID" not in df_users.columns:
             raise ValueError("The users DataFrame must include a 'UserID' column.")
 
-        messages = []
-        user_ids = df_users["UserID"].tolist()
+        user_ids = df_users["UserID"].to_numpy(dtype=np.int64)
+        num_users = len(user_ids)
 
-        if len(user_ids) < 2:
+        if num_users < 2:
             raise ValueError("At least two users are required to generate messages.")
 
-        total_messages = max(min_messages, len(user_ids) * scaling_factor)
-
-        for message_id in range(1, total_messages + 1):
-            sender = random.choice(user_ids)
-            receiver = random.choice(user_ids)
-            while sender == receiver:  
-                receiver = random.choice(user_ids)
-
-            messages.append({
-                "MessageID": message_id,
-                "SenderID": sender,
-                "ReceiverID": receiver,
-                "MessageContent": fake.text(),
-                "MessageDate": fake.date_this_year().isoformat()
-            })
+        total_messages = max(min_messages, num_users * scaling_factor)
+
+        def build_messages(first_id, num_messages):
+            # shifting the sender index by 1..n-1 (mod n) always lands on a different user
+            sender_idx = rng.integers(0, num_users, num_messages)
+            receiver_idx = (sender_idx + rng.integers(1, num_users, num_messages)) % num_users
+
+            df_chunk = pd.DataFrame({
+                "MessageID": np.arange(first_id, first_id + num_messages, dtype=np.int64),
+                "SenderID": user_ids[sender_idx],
+                "ReceiverID": user_ids[receiver_idx],
+                "MessageContent": sample_faker_pool(_fake_text, num_messages),
+                "MessageDate": sample_faker_pool(lambda: _fake_date_year().isoformat(), num_messages)
+            }, copy=False)
+            return as_text_columns(df_chunk, ["MessageContent"])
+
+        if output_format == "csv_stream":
+            file_path = save_table_chunks(
+                (build_messages(start + 1, min(chunk_size, total_messages - start))
+                 for start in range(0, total_messages, chunk_size)),
+                output_filename
+            )
+            print(f"Message table data successfully saved to: {file_path}")
+            return None
 
-        df_messages = pd.DataFrame(messages)
+        df_messages = build_messages(1, total_messages)
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_messages.to_csv(file_path, index=False)
+        file_path = save_table(df_messages, output_filename)
         print(f"Message table data successfully saved to: {file_path}")
 
         return df_messages 
@@ -748,6 +1428,7 @@ Parameters:
 Key Features:
 - Provides a predefined list of house rules commonly used in accommodations.
 - Assigns unique IDs to each rule.
+- Writes the rows straight to CSV with `stream_table` rather than through `DataFrame.to_csv`.
 - Saves the generated data to a CSV file for database initialization or testing purposes.
 
 Returns:
@@ -768,15 +1449,16 @@ def populate_house_rule_table(output_filename="house_rules.csv"):
             "No laundry after 9 PM", "Respect shared spaces"
         ]
 
-        df_house_rules = pd.DataFrame(
-            [{"HouseRuleID": idx + 1, "RuleDescription": rule} for idx, rule in enumerate(house_rules)]
-        )
+        house_rule_columns = {
+            "HouseRuleID": np.arange(1, len(house_rules) + 1, dtype=np.int64),
+            "RuleDescription": house_rules
+        }
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_house_rules.to_csv(file_path, index=False)
+        # small static table: write the rows directly and only wrap them in a DataFrame for the caller
+        file_path = stream_table(house_rule_columns, output_filename)
         print(f"House rule table successfully saved to: {file_path}")
 
-        return df_house_rules 
+        return as_text_columns(pd.DataFrame(house_rule_columns, copy=False), ["RuleDescription"]) 
     except Exception as e:
         print(f"Error: {e}")
         return pd.DataFrame(columns=["HouseRuleID", "RuleDescription"])
@@ -796,9 +1478,10 @@ Parameters:
 
 Key Features:
 - Includes a predefined set of common house rules for realism.
-- Dynamically generates additional rules if the predefined set does not meet the minimum count.
+- Dynamically generates additional rules if the predefined set does not meet the minimum count, taken 
+  from a shuffled enumeration of every action/item/detail combination (at most 150 extra rules).
 - Ensures no duplicate rules are included.
-- Saves the generated rules to a CSV file.
+- Saves the generated rules to a CSV file with `stream_table`, skipping the `DataFrame.to_csv` path.
 
 Returns:
 - A pandas DataFrame containing the house rules data.
@@ -818,29 +1501,33 @@ def populate_house_rule_table(output_filename="house_rules.csv", min_rules=20):
             "No laundry after 9 PM", "Respect shared spaces"
         ]
 
-        dynamic_rules = []
-        while len(predefined_rules) + len(dynamic_rules) < min_rules:
-            action = random.choice(["Avoid", "Do not", "Keep", "Ensure", "Respect", "Always"])
-            item = random.choice(["noise levels", "cleanliness", "neighbor privacy", "shared spaces", "property rules"])
-            detail = random.choice([
-                "at all times", "especially at night", "during your stay",
-                "when using shared facilities", "to maintain harmony"
-            ])
-            rule = f"{action} {item} {detail}"
-            if rule not in predefined_rules and rule not in dynamic_rules:
-                dynamic_rules.append(rule)
+        candidate_rules = np.array([
+            f"{action} {item} {detail}"
+            for action, item, detail in itertools.product(
+                ["Avoid", "Do not", "Keep", "Ensure", "Respect", "Always"],
+                ["noise levels", "cleanliness", "neighbor privacy", "shared spaces", "property rules"],
+                [
+                    "at all times", "especially at night", "during your stay",
+                    "when using shared facilities", "to maintain harmony"
+                ]
+            )
+        ])
+        candidate_rules = candidate_rules[~np.isin(candidate_rules, predefined_rules)]
+        num_dynamic_rules = max(0, min_rules - len(predefined_rules))
+        dynamic_rules = rng.permutation(candidate_rules)[:num_dynamic_rules].tolist()
 
         all_rules = predefined_rules + dynamic_rules
 
-        df_house_rules = pd.DataFrame(
-            [{"HouseRuleID": idx + 1, "RuleDescription": rule} for idx, rule in enumerate(all_rules)]
-        )
+        house_rule_columns = {
+            "HouseRuleID": np.arange(1, len(all_rules) + 1, dtype=np.int64),
+            "RuleDescription": all_rules
+        }
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_house_rules.to_csv(file_path, index=False)
+        # small static table: write the rows directly and only wrap them in a DataFrame for the caller
+        file_path = stream_table(house_rule_columns, output_filename)
         print(f"House rule table successfully saved to: {file_path}")
 
-        return df_house_rules
+        return as_text_columns(pd.DataFrame(house_rule_columns, copy=False), ["RuleDescription"])
     except Exception as e:
         print(f"Error: {e}")
         return pd.DataFrame(columns=["HouseRuleID", "RuleDescription"])
@@ -862,7 +1549,7 @@ Parameters:
 Key Features:
 - Filters bookings with `PaymentStatus == 'paid'` to create corresponding payment records.
 - Ensures each payment record has a valid payment date within the booking period.
-- Validates the integrity of PaymentIDs and BookingIDs to avoid inconsistencies.
+- Validates the integrity of PaymentIDs and BookingIDs when `validate_generated_ids` is enabled.
 - Saves the generated payment data to a CSV file.
 
 Returns:
@@ -881,32 +1568,24 @@ def populate_payment_table(booking_data, output_filename="payments.csv"):
         if paid_bookings.empty:
             raise ValueError("No bookings with PaymentStatus == 'paid' found. Payment table generation cannot proceed.")
 
-        payments = []
-        for i, booking in paid_bookings.iterrows():
-            try:
-                check_in_date = pd.to_datetime(booking["CheckInDate"])
-                check_out_date = pd.to_datetime(booking["CheckOutDate"])
+        check_in_dates = pd.to_datetime(paid_bookings["CheckInDate"]).to_numpy().astype("datetime64[D]")
+        check_out_dates = pd.to_datetime(paid_bookings["CheckOutDate"]).to_numpy().astype("datetime64[D]")
+        stay_days = (check_out_dates - check_in_dates).astype(np.int64)
+        payment_dates = check_in_dates + rng.integers(0, stay_days + 1).astype("timedelta64[D]")
 
-                payment_date = fake.date_between(start_date=check_in_date, end_date=check_out_date)
-                amount = round(booking['TotalAmount'], 2)
+        df_payments = pd.DataFrame({
+            "PaymentID": np.arange(1, len(paid_bookings) + 1, dtype=np.int64),
+            "BookingID": paid_bookings["BookingID"].to_numpy(dtype=np.int64),
+            "PaymentDate": payment_dates.astype(object),
+            "Amount": paid_bookings["TotalAmount"].round(2).to_numpy()
+        }, copy=False)
 
-                payments.append({
-                    "PaymentID": i + 1,  
-                    "BookingID": booking["BookingID"],
-                    "PaymentDate": payment_date,
-                    "Amount": amount
-                })
-            except Exception as inner_error:
-                print(f"Error processing booking ID {booking['BookingID']}: {inner_error}")
+        if validate_generated_ids:
+            missing_bookings = np.setdiff1d(df_payments["BookingID"].to_numpy(), booking_data["BookingID"].to_numpy())
+            if missing_bookings.size:
+                raise ValueError(f"Payments generated for non-existent BookingIDs: {describe_ids(missing_bookings)}")
 
-        df_payments = pd.DataFrame(payments)
-
-        missing_bookings = set(df_payments["BookingID"]) - set(booking_data["BookingID"])
-        if missing_bookings:
-            raise ValueError(f"Payments generated for non-existent BookingIDs: {missing_bookings}")
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_payments.to_csv(file_path, index=False)
+        file_path = save_table(df_payments, output_filename)
         print(f"Payment table successfully saved to: {file_path}")
 
         return df_payments
@@ -935,7 +1614,8 @@ Parameters:
 
 Key Features:
 - Guarantees every accommodation is associated with at least one house rule.
-- Randomly distributes additional house rules to accommodations without duplicates.
+- Randomly distributes additional house rules to accommodations without duplicates using 
+  `sample_covering_pairs`.
 - Converts the generated associations into a DataFrame and saves the data to a CSV file.
 
 Returns:
@@ -951,41 +1631,28 @@ def populate_accommodation_house_rule_table(accommodations_df, house_rules_df,
         if house_rules_df.empty or 'HouseRuleID' not in house_rules_df.columns:
             raise ValueError("House Rules DataFrame is empty or missing 'HouseRuleID' column.")
 
-        accommodations = accommodations_df['AccommodationID'].tolist()
-        house_rules = house_rules_df['HouseRuleID'].tolist()
+        accommodations = accommodations_df['AccommodationID'].to_numpy(dtype=np.int64)
+        house_rules = house_rules_df['HouseRuleID'].to_numpy(dtype=np.int64)
 
-        if not accommodations or not house_rules:
+        if not len(accommodations) or not len(house_rules):
             raise ValueError("No accommodations or house rules found. Cannot populate the table.")
 
-        accommodation_house_rules = set() 
         accommodation_count = len(accommodations)
         house_rule_count = len(house_rules)
+        if total_entries > accommodation_count * house_rule_count:
+            raise ValueError(
+                f"Cannot create {total_entries} unique entries from {accommodation_count} accommodations "
+                f"and {house_rule_count} house rules."
+            )
 
-        for accommodation_id in accommodations:
-            selected_rule = random.choice(house_rules)
-            accommodation_house_rules.add((accommodation_id, selected_rule))
-            total_entries -= 1
-
-            if total_entries <= 0:
-                break
-
-        while total_entries > 0:
-            random_accommodation = random.choice(accommodations)
-            random_rule = random.choice(house_rules)
-
-            if (random_accommodation, random_rule) not in accommodation_house_rules:
-                accommodation_house_rules.add((random_accommodation, random_rule))
-                total_entries -= 1
-
-        accommodation_house_rules_list = [
-            {"AccommodationID": accommodation_id, "HouseRuleID": house_rule_id}
-            for accommodation_id, house_rule_id in accommodation_house_rules
-        ]
+        accommodation_idx, house_rule_idx = sample_covering_pairs(accommodation_count, house_rule_count, total_entries)
 
-        df_accommodation_house_rules = pd.DataFrame(accommodation_house_rules_list)
+        df_accommodation_house_rules = pd.DataFrame({
+            "AccommodationID": accommodations[accommodation_idx],
+            "HouseRuleID": house_rules[house_rule_idx]
+        }, copy=False)
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_accommodation_house_rules.to_csv(file_path, index=False)
+        file_path = save_table(df_accommodation_house_rules, output_filename)
         print(f"AccommodationHouseRule table successfully saved to: {file_path}")
 
         return df_accommodation_house_rules
@@ -1016,40 +1683,40 @@ Returns:
 """
 def generate_diverse_bio():
     """Generate a diverse bio by combining random components."""
-    hobbies = [
-        "travels the world", "is a food lover", "enjoys hiking",
-        "loves painting", "is a marathon runner", "plays the guitar",
-        "writes poetry", "is a bookworm", "photographs wildlife",
-        "dances salsa"
-    ]
-    professions = [
-        "a software developer", "a teacher", "a chef",
-        "a photographer", "an entrepreneur", "a designer",
-        "a fitness trainer", "a musician", "an author",
-        "a scientist"
-    ]
-    traits = [
-        "passionate", "dedicated", "creative", "ambitious",
-        "curious", "outgoing", "kind-hearted", "driven",
-        "optimistic", "thoughtful"
-    ]
-    aspirations = [
-        "to explore new cultures", "to change the world",
-        "to inspire others", "to write a best-selling novel",
-        "to innovate in technology", "to create stunning art",
-        "to lead a healthier life", "to start a global movement",
-        "to build meaningful connections", "to learn something new every day"
-    ]
-
-    hobby = random.choice(hobbies)
-    profession = random.choice(professions)
-    trait = random.choice(traits)
-    aspiration = random.choice(aspirations)
+    hobby = bio_hobbies[rng.integers(len(bio_hobbies))]
+    profession = bio_professions[rng.integers(len(bio_professions))]
+    trait = bio_traits[rng.integers(len(bio_traits))]
+    aspiration = bio_aspirations[rng.integers(len(bio_aspirations))]
 
     bio = f"{trait.capitalize()} and {hobby}, working as {profession}, with a dream {aspiration}."
     return bio
 
 
+"""
+Function: generate_diverse_bios
+
+Purpose:
+Batch version of `generate_diverse_bio`. Draws every component index with one call per list and composes 
+all bios with NumPy string operations instead of one f-string per call.
+
+Parameters:
+- num_bios (int): The number of bios to generate.
+
+Returns:
+- A NumPy object array of `num_bios` bio strings.
+"""
+def generate_diverse_bios(num_bios):
+    traits = np.char.capitalize(bio_traits[rng.integers(0, len(bio_traits), num_bios)])
+    hobbies = bio_hobbies[rng.integers(0, len(bio_hobbies), num_bios)]
+    professions = bio_professions[rng.integers(0, len(bio_professions), num_bios)]
+    aspirations = bio_aspirations[rng.integers(0, len(bio_aspirations), num_bios)]
+
+    bios = np.char.add(np.char.add(traits, " and "), hobbies)
+    bios = np.char.add(np.char.add(bios, ", working as "), professions)
+    bios = np.char.add(np.char.add(bios, ", with a dream "), aspirations)
+    return np.char.add(bios, ".").astype(object)
+
+
 
 
 """
@@ -1066,8 +1733,9 @@ Parameters:
 
 Key Features:
 - Filters out admin users, ensuring profiles are only generated for regular users.
-- Randomly generates diverse bio content, profile picture URLs, and social network links.
-- Validates that all generated profiles correspond to valid user IDs from the input DataFrame.
+- Randomly generates diverse bio content, profile picture URLs, and social network links, building each 
+  column in one pass instead of row by row.
+- Validates that all generated profiles correspond to valid user IDs when `validate_generated_ids` is enabled.
 - Saves the generated profile data to a CSV file.
 
 Returns:
@@ -1076,34 +1744,29 @@ Returns:
 """
 def populate_profile_table(df_users, output_filename="profiles.csv"):
     try:
-        non_admin_users = df_users[df_users["UserType"] != "admin"]
+        user_ids = df_users.loc[df_users["UserType"] != "admin", "UserID"].to_numpy(dtype=np.int64)
 
-        if non_admin_users.empty:
+        if not len(user_ids):
             raise ValueError("No non-admin users available to generate profiles.")
 
-        profiles = []
-        for i, user in non_admin_users.iterrows():
-            user_id = user["UserID"]
-
-            bio = generate_diverse_bio()[:255]
-            profile_picture = fake.image_url()[:255]
-            social_network_link = generate_social_network_url(random.choice(["Facebook", "Twitter", "Instagram", "LinkedIn"]))
-
-            profiles.append({
-                "ProfileID": len(profiles) + 1,
-                "UserID": user_id,
-                "Bio": bio,
-                "ProfilePicture": profile_picture,
-                "SocialNetworkLink": social_network_link
-            })
-        df_profiles = pd.DataFrame(profiles)
-
-        missing_users = set(df_profiles["UserID"]) - set(df_users["UserID"])
-        if missing_users:
-            raise ValueError(f"Profiles generated for non-existent UserIDs: {missing_users}")
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_profiles.to_csv(file_path, index=False)
+        total_profiles = len(user_ids)
+        network_names = rng.choice(social_network_names, total_profiles)
+
+        df_profiles = pd.DataFrame({
+            "ProfileID": np.arange(1, total_profiles + 1, dtype=np.int64),
+            "UserID": user_ids,
+            "Bio": generate_diverse_bios(total_profiles).astype("U255").astype(object),
+            "ProfilePicture": sample_faker_pool(lambda: _fake_image_url()[:255], total_profiles),
+            "SocialNetworkLink": generate_social_network_urls(network_names)
+        }, copy=False)
+        df_profiles = as_text_columns(df_profiles, ["Bio", "ProfilePicture", "SocialNetworkLink"])
+
+        if validate_generated_ids:
+            missing_users = np.setdiff1d(df_profiles["UserID"].to_numpy(), df_users["UserID"].to_numpy())
+            if missing_users.size:
+                raise ValueError(f"Profiles generated for non-existent UserIDs: {describe_ids(missing_users)}")
+
+        file_path = save_table(df_profiles, output_filename)
         print(f"Profile table data successfully saved to: {file_path}")
 
         return df_profiles
@@ -1136,14 +1799,28 @@ Returns:
 """
 def generate_social_network_url(network_name):
     """Generate a realistic social network URL based on the network name."""
-    base_urls = {
-        "Twitter": "https://twitter.com",
-        "Facebook": "https://facebook.com",
-        "Instagram": "https://instagram.com",
-        "LinkedIn": "https://linkedin.com/in"
-    }
-    username = fake.user_name()
-    return f"{base_urls.get(network_name, fake.url())}/{username}"
+    username = _fake_user_name()
+    return f"{social_network_base_urls.get(network_name) or fake.url()}/{username}"
+
+
+"""
+Function: generate_social_network_urls
+
+Purpose:
+Batch version of `generate_social_network_url`. Looks up the base URL for every network name at once and 
+joins it to a freshly generated username with NumPy string operations.
+
+Parameters:
+- network_names (array-like): The social network name for each URL to generate.
+
+Returns:
+- A NumPy object array of profile URLs, one per network name.
+"""
+def generate_social_network_urls(network_names):
+    network_names = np.asarray(network_names, dtype=object)
+    base_urls = np.array([social_network_base_urls.get(name) or fake.url() for name in network_names], dtype=str)
+    usernames = np.array([_fake_user_name() for _ in range(len(network_names))], dtype=str)
+    return np.char.add(np.char.add(base_urls, "/"), usernames).astype(object)
 
 
 """
@@ -1160,7 +1837,7 @@ Parameters:
 
 Key Features:
 - Assigns social network profiles to a subset of users (30% chance per user).
-- Each user may have between one and three unique social networks.
+- Each user may have between one and three unique social networks, sampled without replacement in bulk.
 - Generates realistic social network profile URLs using predefined network names and random usernames.
 - Saves the generated social network data to a CSV file.
 
@@ -1175,29 +1852,25 @@ def populate_social_network_table(df_users, output_filename="social_networks.csv
         if "UserID" not in df_users.columns:
             raise ValueError("The users DataFrame must include a 'UserID' column.")
 
-        social_networks = []
-        user_ids = df_users["UserID"].tolist()
-
-        for user_id in user_ids:
-            if random.random() <= 0.3:  
-                num_networks = random.randint(1, 3) 
-                used_networks = set()
-                for _ in range(num_networks):
-                    network_name = random.choice(['Facebook', 'Twitter', 'Instagram', 'LinkedIn'])
-                    if network_name in used_networks:
-                        continue
-                    used_networks.add(network_name)
-
-                    social_networks.append({
-                        "UserID": user_id,
-                        "NetworkName": network_name,
-                        "NetworkProfileURL": generate_social_network_url(network_name)
-                    })
-
-        df_social_networks = pd.DataFrame(social_networks)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_social_networks.to_csv(file_path, index=False)
+        user_ids = df_users["UserID"].to_numpy(dtype=np.int64)
+
+        active_user_ids = user_ids[rng.random(len(user_ids)) <= 0.3]
+        num_networks = rng.integers(1, 4, len(active_user_ids))
+
+        # a random permutation of the networks per user; keeping the first num_networks columns
+        # gives each user that many distinct networks without retrying duplicates
+        network_order = np.argsort(rng.random((len(active_user_ids), len(social_network_names))), axis=1)
+        keep = np.arange(len(social_network_names)) < num_networks[:, None]
+        selected_networks = social_network_names[network_order[keep]]
+
+        df_social_networks = pd.DataFrame({
+            "UserID": np.repeat(active_user_ids, num_networks),
+            "NetworkName": selected_networks,
+            "NetworkProfileURL": generate_social_network_urls(selected_networks)
+        }, copy=False)
+        df_social_networks = as_text_columns(df_social_networks, ["NetworkProfileURL"])
+
+        file_path = save_table(df_social_networks, output_filename)
         print(f"SocialNetwork table successfully saved to: {file_path}")
 
         return df_social_networks
@@ -1223,8 +1896,8 @@ Parameters:
 
 Key Features:
 - Validates the accommodations DataFrame to ensure required columns are present.
-- Dynamically calculates prices using the `generate_dynamic_price` function, considering property-specific attributes.
-- Validates that all generated prices correspond to valid accommodations.
+- Dynamically calculates prices with the `generate_dynamic_price` formula, applied to whole columns at once.
+- Validates that all generated prices correspond to valid accommodations when `validate_generated_ids` is enabled.
 - Saves the generated price data to a CSV file.
 
 Returns:
@@ -1242,29 +1915,27 @@ def populate_price_table(df_accommodations, output_filename="prices.csv"):
 
         print(f"Generating prices for {len(df_accommodations)} accommodations...")
 
-        prices = []
-        for i, (_, accommodation) in enumerate(df_accommodations.iterrows(), start=1):
-            accommodation_id = accommodation["AccommodationID"]
-            property_type = accommodation["PropertyType"]
-            square_footage = accommodation["SquareFootage"]
-            host_rating = accommodation["HostRating"]
-
-            amount = generate_dynamic_price(property_type, square_footage, host_rating)
-
-            prices.append({
-                "PriceID": i, 
-                "AccommodationID": accommodation_id,
-                "Amount": amount
-            })
+        base_prices = (
+            df_accommodations["PropertyType"].str.lower().map(property_base_prices).fillna(50).to_numpy(dtype=np.float64)
+        )
+        price_modifiers = (
+            df_accommodations["SquareFootage"].to_numpy(dtype=np.float64) / 1000
+            + df_accommodations["HostRating"].to_numpy(dtype=np.float64) / 5
+        )
+        amounts = np.clip(np.round(base_prices * price_modifiers, 2), 50, 1000)
 
-        df_prices = pd.DataFrame(prices)
+        df_prices = pd.DataFrame({
+            "PriceID": np.arange(1, len(df_accommodations) + 1, dtype=np.int64),
+            "AccommodationID": df_accommodations["AccommodationID"].to_numpy(dtype=np.int64),
+            "Amount": amounts
+        }, copy=False)
 
-        missing_accommodations = set(df_prices["AccommodationID"]) - set(df_accommodations["AccommodationID"])
-        if missing_accommodations:
-            raise ValueError(f"Prices generated for non-existent AccommodationIDs: {missing_accommodations}")
+        if validate_generated_ids:
+            missing_accommodations = np.setdiff1d(df_prices["AccommodationID"].to_numpy(), df_accommodations["AccommodationID"].to_numpy())
+            if missing_accommodations.size:
+                raise ValueError(f"Prices generated for non-existent AccommodationIDs: {describe_ids(missing_accommodations)}")
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_prices.to_csv(file_path, index=False)
+        file_path = save_table(df_prices, output_filename)
         print(f"Price table successfully saved to: {file_path}")
 
         return df_prices
@@ -1299,14 +1970,7 @@ Returns:
 - A float representing the calculated price.
 """
 def generate_dynamic_price(property_type, square_footage, host_rating):
-    base_price = {
-        "apartment": 50,
-        "villa": 100,
-        "house": 80,
-        "studio": 40,
-        "cabin": 60,
-        "boathouse": 90
-    }.get(property_type.lower(), 50)   
+    base_price = property_base_prices.get(property_type.lower(), 50)   
 
     price_modifier = (square_footage / 1000) + (host_rating / 5)
     final_price = round(base_price * price_modifier, 2)
@@ -1327,7 +1991,8 @@ Parameters:
 
 Key Features:
 - Provides a predefined list of common amenities for accommodations.
-- Dynamically generates additional amenities if the predefined list does not meet the minimum count.
+- Dynamically generates additional amenities if the predefined list does not meet the minimum count, 
+  drawing candidate words from Faker in batches and deduplicating them with NumPy.
 - Ensures all amenities are unique and realistic.
 - Saves the generated data to a CSV file.
 
@@ -1346,20 +2011,23 @@ def populate_amenity_table(output_filename="amenities.csv", min_amenities=20):
         ]
 
         dynamic_amenities = []
-        while len(predefined_amenities) + len(dynamic_amenities) < min_amenities:
-            new_amenity = fake.word().capitalize() + " Facility"
-            if new_amenity not in predefined_amenities and new_amenity not in dynamic_amenities:
-                dynamic_amenities.append(new_amenity)
+        needed = min_amenities - len(predefined_amenities)
+        while needed > 0:
+            candidates = np.char.add(
+                np.char.capitalize(np.array(fake.words(max(64, needed * 3)))), " Facility"
+            )
+            candidates = pd.unique(candidates[~np.isin(candidates, predefined_amenities + dynamic_amenities)])
+            dynamic_amenities.extend(candidates[:needed].tolist())
+            needed = min_amenities - len(predefined_amenities) - len(dynamic_amenities)
 
         all_amenities = predefined_amenities + dynamic_amenities
 
         df_amenities = pd.DataFrame({
-            "AmenityID": range(1, len(all_amenities) + 1),
+            "AmenityID": np.arange(1, len(all_amenities) + 1, dtype=np.int64),
             "AmenityName": all_amenities
-        })
+        }, copy=False)
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_amenities.to_csv(file_path, index=False)
+        file_path = save_table(df_amenities, output_filename)
         print(f"Amenity table successfully saved to: {file_path}")
 
         return df_amenities
@@ -1387,7 +2055,8 @@ Parameters:
 
 Key Features:
 - Ensures every accommodation is assigned at least one amenity.
-- Distributes additional amenities randomly across accommodations without duplicating existing pairs.
+- Distributes additional amenities randomly across accommodations without duplicating existing pairs, 
+  sampling all pairs at once with `sample_covering_pairs`.
 - Converts the generated data into a DataFrame and saves it to a CSV file.
 
 Returns:
@@ -1403,46 +2072,26 @@ def populate_accommodation_amenity_table(accommodations, amenities,
         if amenities.empty:
             raise ValueError("The amenities DataFrame is empty. Cannot populate AccommodationAmenity table.")
 
-        accommodation_amenities = []
-        accommodation_amenity_id = 1
-
-        remaining_entries = total_entries
-        for _, accommodation in accommodations.iterrows():
-            accommodation_id = accommodation["AccommodationID"]
-
-            selected_amenities = random.sample(list(amenities["AmenityID"]), k=1)
-            for amenity_id in selected_amenities:
-                accommodation_amenities.append({
-                    "AccommodationAmenityID": accommodation_amenity_id,
-                    "AccommodationID": accommodation_id,
-                    "AmenityID": amenity_id
-                })
-                accommodation_amenity_id += 1
-                remaining_entries -= 1
-
-            if remaining_entries <= 0:
-                break
-
-        while remaining_entries > 0:
-            random_accommodation = random.choice(accommodations["AccommodationID"])
-            random_amenity = random.choice(amenities["AmenityID"])
-
-            if not any(
-                entry["AccommodationID"] == random_accommodation and entry["AmenityID"] == random_amenity
-                for entry in accommodation_amenities
-            ):
-                accommodation_amenities.append({
-                    "AccommodationAmenityID": accommodation_amenity_id,
-                    "AccommodationID": random_accommodation,
-                    "AmenityID": random_amenity
-                })
-                accommodation_amenity_id += 1
-                remaining_entries -= 1
-
-        df_accommodation_amenities = pd.DataFrame(accommodation_amenities)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_accommodation_amenities.to_csv(file_path, index=False)
+        accommodation_ids = accommodations["AccommodationID"].to_numpy(dtype=np.int64)
+        amenity_ids = amenities["AmenityID"].to_numpy(dtype=np.int64)
+
+        accommodation_count = len(accommodation_ids)
+        amenity_count = len(amenity_ids)
+        if total_entries > accommodation_count * amenity_count:
+            raise ValueError(
+                f"Cannot create {total_entries} unique entries from {accommodation_count} accommodations "
+                f"and {amenity_count} amenities."
+            )
+
+        accommodation_idx, amenity_idx = sample_covering_pairs(accommodation_count, amenity_count, total_entries)
+
+        df_accommodation_amenities = pd.DataFrame({
+            "AccommodationAmenityID": np.arange(1, len(accommodation_idx) + 1, dtype=np.int64),
+            "AccommodationID": accommodation_ids[accommodation_idx],
+            "AmenityID": amenity_ids[amenity_idx]
+        }, copy=False)
+
+        file_path = save_table(df_accommodation_amenities, output_filename)
         print(f"AccommodationAmenity table successfully saved to: {file_path}")
 
         return df_accommodation_amenities
@@ -1462,22 +2111,14 @@ The function provides varied, human-like feedback suitable for simulating user r
 
 Key Features:
 - Includes a mix of positive, neutral, and slightly critical review sentiments.
-- Randomly selects a review text to ensure diversity in generated reviews.
+- Randomly selects a review text from the module-level `review_sentiments` array to ensure diversity.
 - Produces concise, realistic feedback suitable for user review simulations.
 
 Returns:
 - A string representing a realistic review.
 """
 def generate_realistic_review():
-    sentiments = [
-        "Excellent stay!", "Highly recommended!", "A very cozy place.",
-        "Would definitely book again.", "The amenities were great.",
-        "Perfect location!", "Wonderful host!", "A bit noisy but manageable.",
-        "Loved the view!", "Clean and comfortable.", "A true home away from home.",
-        "Met all my expectations.", "The pool was fantastic!", "Convenient and affordable.",
-        "I'll be coming back for sure.", "Forever am I at work here."
-    ]
-    return random.choice(sentiments)
+    return review_sentiments[rng.integers(len(review_sentiments))]
 
 """
 Function: populate_review_table
@@ -1496,7 +2137,9 @@ Parameters:
 
 Key Features:
 - Generates reviews only for confirmed bookings to ensure realism.
-- Includes realistic review text and ratings between 3 and 5.
+- Includes realistic review text and ratings between 3 and 5, sampled for all reviews in one draw each.
+- Dates reviews with NumPy datetime64 offsets: between check-in and today for booked stays, and within the 
+  last two years for additional reviews.
 - Ensures a minimum number of reviews by randomly generating additional reviews as needed.
 - Saves the generated review data to a CSV file.
 
@@ -1515,9 +2158,6 @@ def populate_review_table(accommodations, bookings, users,
         if users.empty:
             raise ValueError("The users DataFrame is empty. Cannot populate Review table.")
 
-        reviews = []
-        review_id = 1
-
         confirmed_bookings = bookings[bookings["BookingStatus"] == "confirmed"]
 
         if confirmed_bookings.empty:
@@ -1525,48 +2165,31 @@ def populate_review_table(accommodations, bookings, users,
 
         print(f"Generating reviews based on {len(confirmed_bookings)} confirmed bookings...")
 
-        for _, booking in confirmed_bookings.iterrows():
-            accommodation_id = booking["AccommodationID"]
-            user_id = booking["GuestID"]  
-            review_text = generate_realistic_review()
-            rating = random.randint(3, 5)
-            review_date = fake.date_between(start_date=booking["CheckInDate"], end_date='today').isoformat()
-
-            reviews.append({
-                "ReviewID": review_id,
-                "AccommodationID": accommodation_id,
-                "UserID": user_id,
-                "ReviewText": review_text,
-                "Rating": rating,
-                "ReviewDate": review_date
-            })
-            review_id += 1
-
-        additional_reviews_needed = max(0, min_reviews - len(reviews))
-        accommodation_ids = accommodations["AccommodationID"].tolist()
-
-        while additional_reviews_needed > 0:
-            accommodation_id = random.choice(accommodation_ids)
-            user_id = random.choice(users["UserID"])
-            review_text = generate_realistic_review()
-            rating = random.randint(3, 5)
-            review_date = fake.date_between(start_date='-2y', end_date='today').isoformat()
-
-            reviews.append({
-                "ReviewID": review_id,
-                "AccommodationID": accommodation_id,
-                "UserID": user_id,
-                "ReviewText": review_text,
-                "Rating": rating,
-                "ReviewDate": review_date
-            })
-            review_id += 1
-            additional_reviews_needed -= 1
-
-        df_reviews = pd.DataFrame(reviews)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_reviews.to_csv(file_path, index=False)
+        # each review is dated uniformly between its booking's check-in and today
+        today = np.datetime64(date.today(), "D")
+        check_in_dates = pd.to_datetime(confirmed_bookings["CheckInDate"]).to_numpy().astype("datetime64[D]")
+        review_spans = np.maximum((today - check_in_dates).astype(np.int64), 0)
+        booking_review_dates = check_in_dates + rng.integers(0, review_spans + 1).astype("timedelta64[D]")
+
+        additional_reviews_needed = max(0, min_reviews - len(confirmed_bookings))
+        accommodation_ids = accommodations["AccommodationID"].to_numpy(dtype=np.int64)
+        user_ids = users["UserID"].to_numpy(dtype=np.int64)
+
+        extra_accommodation_ids = accommodation_ids[rng.integers(0, len(accommodation_ids), additional_reviews_needed)]
+        extra_user_ids = user_ids[rng.integers(0, len(user_ids), additional_reviews_needed)]
+        extra_review_dates = today - rng.integers(0, 2 * 365 + 1, additional_reviews_needed).astype("timedelta64[D]")
+
+        total_reviews = len(confirmed_bookings) + additional_reviews_needed
+        df_reviews = pd.DataFrame({
+            "ReviewID": np.arange(1, total_reviews + 1, dtype=np.int64),
+            "AccommodationID": np.concatenate([confirmed_bookings["AccommodationID"].to_numpy(dtype=np.int64), extra_accommodation_ids]),
+            "UserID": np.concatenate([confirmed_bookings["GuestID"].to_numpy(dtype=np.int64), extra_user_ids]),
+            "ReviewText": review_sentiments[rng.integers(0, len(review_sentiments), total_reviews)],
+            "Rating": rng.integers(3, 6, total_reviews),
+            "ReviewDate": np.concatenate([booking_review_dates, extra_review_dates]).astype(str)
+        }, copy=False)
+
+        file_path = save_table(df_reviews, output_filename)
         print(f"Review table successfully saved to: {file_path}")
 
         print(f"Total reviews generated: {len(df_reviews)}")
@@ -1596,7 +2219,8 @@ Parameters:
 
 Key Features:
 - Generates responses for a random subset of reviews, with a 50% chance for each review to receive a response.
-- Ensures a minimum number of responses by randomly selecting additional reviews if necessary.
+- Ensures a minimum number of responses by randomly selecting additional, not yet answered reviews if necessary.
+- Draws response texts from a pre-generated Faker pool (`sample_faker_pool`) instead of one Faker call per response.
 - Saves the generated host response data to a CSV file.
 
 Returns:
@@ -1608,36 +2232,28 @@ def populate_host_response_table(reviews, output_filename="host_responses.csv",
         if reviews.empty:
             raise ValueError("Reviews DataFrame is empty. Cannot populate HostResponse table.")
 
-        host_responses = []
-        eligible_reviews = reviews["ReviewID"].tolist()
+        eligible_reviews = reviews["ReviewID"].to_numpy(dtype=np.int64)
 
         if len(eligible_reviews) < min_responses:
             raise ValueError(f"Insufficient reviews ({len(eligible_reviews)}) to generate the required minimum {min_responses} host responses.")
 
         print(f"Generating at least {min_responses} host responses...")
 
-        for review_id in eligible_reviews:
-            if random.random() < 0.5:  
-                response_text = fake.text()
-                host_responses.append({
-                    "ReviewID": review_id,
-                    "ResponseText": response_text
-                })
+        responded = rng.random(len(eligible_reviews)) < 0.5
+        responded_reviews = eligible_reviews[responded]
 
-        additional_responses_needed = max(0, min_responses - len(host_responses))
+        additional_responses_needed = max(0, min_responses - len(responded_reviews))
         if additional_responses_needed > 0:
-            additional_reviews = random.sample(eligible_reviews, additional_responses_needed)
-            for review_id in additional_reviews:
-                response_text = fake.text()
-                host_responses.append({
-                    "ReviewID": review_id,
-                    "ResponseText": response_text
-                })
-
-        df_host_responses = pd.DataFrame(host_responses)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_host_responses.to_csv(file_path, index=False)
+            # top up from reviews that did not get a response yet, so no review is answered twice
+            additional_reviews = rng.choice(eligible_reviews[~responded], additional_responses_needed, replace=False)
+            responded_reviews = np.concatenate([responded_reviews, additional_reviews])
+
+        df_host_responses = pd.DataFrame({
+            "ReviewID": responded_reviews,
+            "ResponseText": sample_faker_pool(_fake_text, len(responded_reviews))
+        }, copy=False)
+
+        file_path = save_table(df_host_responses, output_filename)
         print(f"HostResponse table successfully saved to: {file_path}")
 
         return df_host_responses
@@ -1669,7 +2285,7 @@ Key Features:
   - 10% for amounts > $500
   - 15% for amounts ≤ $500
 - Skips bookings with invalid or non-positive total amounts.
-- Validates that all calculated commissions correspond to valid BookingIDs.
+- Validates that all calculated commissions correspond to valid BookingIDs when `validate_generated_ids` is enabled.
 - Saves the generated commission data to a CSV file.
 
 Returns:
@@ -1689,38 +2305,26 @@ def populate_commission_table(bookings, output_filename="commissions.csv"):
             print("No confirmed bookings found. Returning an empty DataFrame.")
             return pd.DataFrame(columns=["BookingID", "Amount"])
 
-        commissions = []
-
-        for _, booking in confirmed_bookings.iterrows():
-            booking_id = booking["BookingID"]
-            total_amount = booking["TotalAmount"]
-
-            if total_amount <= 0:
-                print(f"Skipping booking ID {booking_id} due to invalid TotalAmount: {total_amount}")
-                continue
-
-            if total_amount > 1000:
-                commission_percentage = 5  
-            elif total_amount > 500:
-                commission_percentage = 10 
-            else:
-                commission_percentage = 15  
+        booking_ids = confirmed_bookings["BookingID"].to_numpy(dtype=np.int64)
+        total_amounts = confirmed_bookings["TotalAmount"].to_numpy(dtype=np.float64)
 
-            amount = round(total_amount * (commission_percentage / 100), 2)
+        invalid = total_amounts <= 0
+        for booking_id, total_amount in zip(booking_ids[invalid], total_amounts[invalid]):
+            print(f"Skipping booking ID {booking_id} due to invalid TotalAmount: {total_amount}")
 
-            commissions.append({
-                "BookingID": booking_id,
-                "Amount": amount
-            })
+        commission_rates = np.select([total_amounts > 1000, total_amounts > 500], [0.05, 0.10], default=0.15)
 
-        df_commissions = pd.DataFrame(commissions)
+        df_commissions = pd.DataFrame({
+            "BookingID": booking_ids[~invalid],
+            "Amount": np.round(total_amounts * commission_rates, 2)[~invalid]
+        }, copy=False)
 
-        missing_booking_ids = set(df_commissions["BookingID"]) - set(bookings["BookingID"])
-        if missing_booking_ids:
-            raise ValueError(f"Commissions generated for non-existent BookingIDs: {missing_booking_ids}")
+        if validate_generated_ids:
+            missing_booking_ids = np.setdiff1d(df_commissions["BookingID"].to_numpy(), bookings["BookingID"].to_numpy())
+            if missing_booking_ids.size:
+                raise ValueError(f"Commissions generated for non-existent BookingIDs: {describe_ids(missing_booking_ids)}")
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_commissions.to_csv(file_path, index=False)
+        file_path = save_table(df_commissions, output_filename)
         print(f"Commission table successfully saved to: {file_path}")
 
         return df_commissions
@@ -1765,21 +2369,13 @@ def populate_admin_table(users, output_filename="admins.csv", min_admins=20):
 
         print(f"Ensuring all {len(admin_users)} users marked as admins are listed in the Admin table.")
 
-        roles = ['SuperAdmin', 'Admin', 'Moderator']
-        admin_entries = []
-
-        for _, user in admin_users.iterrows():
-            role = random.choices(roles, weights=[30, 50, 20], k=1)[0] 
-            admin_entries.append({
-                "AdminID": len(admin_entries) + 1,
-                "UserID": user["UserID"],
-                "Role": role
-            })
+        df_admins = pd.DataFrame({
+            "AdminID": np.arange(1, len(admin_users) + 1, dtype=np.int64),
+            "UserID": admin_users["UserID"].to_numpy(dtype=np.int64),
+            "Role": rng.choice(admin_roles, size=len(admin_users), p=admin_role_weights)
+        }, copy=False)
 
-        df_admins = pd.DataFrame(admin_entries)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_admins.to_csv(file_path, index=False)
+        file_path = save_table(df_admins, output_filename)
         print(f"Admin table successfully saved to: {file_path}")
 
         return df_admins
@@ -1805,7 +2401,8 @@ Parameters:
 Key Features:
 - Assigns a set of random actions to each admin, ensuring at least `min_actions` total.
 - Dynamically scales the number of actions based on the number of admins.
-- Generates realistic action descriptions and timestamps.
+- Generates realistic action descriptions and timestamps, drawing all descriptions in one call and dates 
+  from a pre-generated Faker pool.
 - Saves the generated admin action data to a CSV file.
 
 Returns:
@@ -1819,47 +2416,24 @@ def populate_admin_action_table(admins, output_filename="admin_actions.csv", min
         if "AdminID" not in admins.columns:
             raise ValueError("Admins DataFrame must include an 'AdminID' column.")
 
-        admin_actions = []
-        action_id = 1  
-
         total_actions = max(min_actions, len(admins) * 10) 
         print(f"Generating at least {min_actions} actions for {len(admins)} admins...")
 
         actions_per_admin = total_actions // len(admins)
         remaining_actions = total_actions % len(admins)
 
-        for _, admin in admins.iterrows():
-            admin_id = admin["AdminID"]
-
-            num_actions = actions_per_admin + (1 if remaining_actions > 0 else 0)
-            if remaining_actions > 0:
-                remaining_actions -= 1
-
-            for _ in range(num_actions):
-                action_description = random.choice([
-                    "Updated user profile",
-                    "Moderated a review",
-                    "Deleted a comment",
-                    "Resolved a user complaint",
-                    "Banned a user",
-                    "Approved new accommodation",
-                    "Changed booking status",
-                    "Reviewed system logs"
-                ])
-                action_date = fake.date_this_year().isoformat()
-
-                admin_actions.append({
-                    "ActionID": action_id,
-                    "AdminID": admin_id,
-                    "ActionDescription": action_description,
-                    "ActionDate": action_date
-                })
-                action_id += 1
-
-        df_admin_actions = pd.DataFrame(admin_actions)
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_admin_actions.to_csv(file_path, index=False)
+        # the first `remaining_actions` admins take one extra action each
+        num_actions = np.full(len(admins), actions_per_admin)
+        num_actions[:remaining_actions] += 1
+
+        df_admin_actions = pd.DataFrame({
+            "ActionID": np.arange(1, total_actions + 1, dtype=np.int64),
+            "AdminID": np.repeat(admins["AdminID"].to_numpy(dtype=np.int64), num_actions),
+            "ActionDescription": admin_action_descriptions[rng.integers(0, len(admin_action_descriptions), total_actions)],
+            "ActionDate": sample_faker_pool(lambda: _fake_date_year().isoformat(), total_actions)
+        }, copy=False)
+
+        file_path = save_table(df_admin_actions, output_filename)
         print(f"AdminAction table successfully saved to: {file_path}")
 
         return df_admin_actions
@@ -1887,7 +2461,7 @@ Parameters:
   defaults to the number of unique payments.
 
 Key Features:
-- Associates each transaction with a valid payment ID.
+- Associates each transaction with a valid payment ID, drawing all payment indices in a single call.
 - Randomly generates transaction types (Credit/Debit) and payment methods.
 - Ensures a sufficient number of transactions are generated, matching or exceeding the number of payments.
 - Saves the generated transaction data to a CSV file.
@@ -1905,38 +2479,25 @@ def populate_transaction_table(payments, output_filename="transactions.csv", tot
         if total_transactions < len(payments):
             raise ValueError("Total transactions must be at least equal to the number of unique payments.")
 
-        payment_methods = ['Credit Card', 'Debit Card', 'Bank Transfer', 'PayPal', 'Cryptocurrency']
-        transactions = []
-        transaction_id = 1
-
         print(f"Generating {total_transactions} transactions for {len(payments)} payments...")
 
-        for _ in range(total_transactions):
-            payment = payments.sample(1).iloc[0] 
-            payment_id = payment["PaymentID"]
-            transaction_date = fake.date_this_year().isoformat()
-            transaction_type = random.choice(['Credit', 'Debit'])
-            amount = round(payment["Amount"], 2)
-            payment_method = random.choice(payment_methods)
-
-            transactions.append({
-                "TransactionID": transaction_id,
-                "PaymentID": payment_id,
-                "TransactionDate": transaction_date,
-                "TransactionType": transaction_type,
-                "Amount": amount,
-                "PaymentMethod": payment_method
-            })
-            transaction_id += 1
-
-        df_transactions = pd.DataFrame(transactions)
-
-        missing_payments = set(df_transactions["PaymentID"]) - set(payments["PaymentID"])
-        if missing_payments:
-            raise ValueError(f"Transactions generated for non-existent PaymentIDs: {missing_payments}")
-
-        file_path = os.path.join(output_directory, output_filename)
-        df_transactions.to_csv(file_path, index=False)
+        payment_idx = rng.integers(0, len(payments), total_transactions)
+
+        df_transactions = pd.DataFrame({
+            "TransactionID": np.arange(1, total_transactions + 1, dtype=np.int64),
+            "PaymentID": payments["PaymentID"].to_numpy(dtype=np.int64)[payment_idx],
+            "TransactionDate": sample_faker_pool(lambda: _fake_date_year().isoformat(), total_transactions),
+            "TransactionType": rng.choice(transaction_types, total_transactions),
+            "Amount": np.round(payments["Amount"].to_numpy(dtype=np.float64)[payment_idx], 2),
+            "PaymentMethod": rng.choice(payment_methods, total_transactions)
+        }, copy=False)
+
+        if validate_generated_ids:
+            missing_payments = np.setdiff1d(df_transactions["PaymentID"].to_numpy(), payments["PaymentID"].to_numpy())
+            if missing_payments.size:
+                raise ValueError(f"Transactions generated for non-existent PaymentIDs: {describe_ids(missing_payments)}")
+
+        file_path = save_table(df_transactions, output_filename)
         print(f"Transaction table successfully saved to: {file_path}")
 
         return df_transactions  
@@ -1965,8 +2526,8 @@ Parameters:
 
 Key Features:
 - Dynamically scales the total number of notifications based on the number of users.
-- Distributes notifications evenly across users, ensuring fairness.
-- Generates realistic notification messages and timestamps.
+- Distributes notifications evenly across users with a single per-user count array and `np.repeat`.
+- Generates realistic notification messages and timestamps, sampled from pre-generated Faker pools.
 - Saves the generated notification data to a CSV file.
 
 Returns:
@@ -1978,8 +2539,6 @@ def populate_notification_table(users, output_filename="notifications.csv", min_
         if users.empty or "UserID" not in users.columns:
             raise ValueError("Users DataFrame must include a non-empty 'UserID' column.")
 
-        notifications = []
-
         user_count = len(users)
         if user_count == 0:
             raise ValueError("No users available to assign notifications.")
@@ -1991,23 +2550,17 @@ def populate_notification_table(users, output_filename="notifications.csv", min_
         notifications_per_user = total_notifications // user_count
         remaining_notifications = total_notifications % user_count
 
-        for i, user in users.iterrows():
-            user_notifications = notifications_per_user + (1 if i < remaining_notifications else 0)
-
-            for _ in range(user_notifications):
-                notification_message = fake.text()
-                notification_date = fake.date_this_year().isoformat()
-
-                notifications.append({
-                    "UserID": user["UserID"],
-                    "NotificationMessage": notification_message,
-                    "NotificationDate": notification_date
-                })
+        notification_counts = np.full(user_count, notifications_per_user)
+        notification_counts[:remaining_notifications] += 1
+        notification_user_ids = np.repeat(users["UserID"].to_numpy(dtype=np.int64), notification_counts)
 
-        df_notifications = pd.DataFrame(notifications)
+        df_notifications = pd.DataFrame({
+            "UserID": notification_user_ids,
+            "NotificationMessage": sample_faker_pool(_fake_text, len(notification_user_ids)),
+            "NotificationDate": sample_faker_pool(lambda: _fake_date_year().isoformat(), len(notification_user_ids))
+        }, copy=False)
 
-        file_path = os.path.join(output_directory, output_filename)
-        df_notifications.to_csv(file_path, index=False)
+        file_path = save_table(df_notifications, output_filename)
         print(f"Notification table successfully saved to: {file_path}")
 
         return df_notifications  
@@ -2050,15 +2603,18 @@ def validate_tables(users, admins, accommodations):
 
     if len(admins) < 20:
         issues.append("Admin table has fewer than 20 entries.")
-    invalid_admin_users = set(admins["UserID"]) - set(users["UserID"])
-    if invalid_admin_users:
-        issues.append(f"Admin table has UserIDs that do not exist in Users table: {invalid_admin_users}.")
+    invalid_admin_mask = missing_id_mask(admins["UserID"], users["UserID"])
+    if invalid_admin_mask.any():
+        invalid_admin_users = admins.loc[invalid_admin_mask, "UserID"].unique()
+        issues.append(f"Admin table has UserIDs that do not exist in Users table: {describe_ids(invalid_admin_users)}.")
 
     if len(accommodations) < 20:
         issues.append("Accommodation table has fewer than 20 entries.")
-    invalid_accommodation_hosts = set(accommodations["HostID"]) - set(users[users["UserType"] == "host"]["UserID"])
-    if invalid_accommodation_hosts:
-        issues.append(f"Accommodation table has HostIDs that are not valid Hosts in Users table: {invalid_accommodation_hosts}.")
+    host_ids = users.loc[users["UserType"] == "host", "UserID"]
+    invalid_host_mask = missing_id_mask(accommodations["HostID"], host_ids)
+    if invalid_host_mask.any():
+        invalid_accommodation_hosts = accommodations.loc[invalid_host_mask, "HostID"].unique()
+        issues.append(f"Accommodation table has HostIDs that are not valid Hosts in Users table: {describe_ids(invalid_accommodation_hosts)}.")
 
     if not issues:
         return "All tables and dependencies validated successfully."
@@ -2087,39 +2643,39 @@ Prints validation results and highlights any errors or warnings in data consiste
 """
 def verify_data_integrity(users, accommodations, bookings):
     try:
-        hosts = users[users["UserType"] == "host"]["UserID"].tolist()
-        accommodations_hosts = accommodations["HostID"].tolist()
-        invalid_hosts = [host for host in accommodations_hosts if host not in hosts]
-        if invalid_hosts:
-            print(f"Error: Accommodations have invalid hosts: {invalid_hosts}")
+        hosts = users.loc[users["UserType"] == "host", "UserID"]
+        invalid_host_mask = missing_id_mask(accommodations["HostID"], hosts)
+        if invalid_host_mask.any():
+            invalid_hosts = accommodations.loc[invalid_host_mask, "HostID"].unique()
+            print(f"Error: Accommodations have invalid hosts: {describe_ids(invalid_hosts)}")
         else:
             print("All accommodations have valid hosts.")
 
-        guests = users[users["UserType"] == "guest"]["UserID"].tolist()
-        bookings_guests = bookings["GuestID"].tolist()
-        invalid_guests = [guest for guest in bookings_guests if guest not in guests]
-        if invalid_guests:
-            print(f"Error: Bookings have invalid guests: {invalid_guests}")
+        guests = users.loc[users["UserType"] == "guest", "UserID"]
+        invalid_guest_mask = missing_id_mask(bookings["GuestID"], guests)
+        if invalid_guest_mask.any():
+            invalid_guests = bookings.loc[invalid_guest_mask, "GuestID"].unique()
+            print(f"Error: Bookings have invalid guests: {describe_ids(invalid_guests)}")
         else:
             print("All bookings have valid guests.")
 
-        accommodations_ids = accommodations["AccommodationID"].tolist()
-        bookings_accommodations = bookings["AccommodationID"].tolist()
-        invalid_accommodations = [
-            acc for acc in bookings_accommodations if acc not in accommodations_ids
-        ]
-        if invalid_accommodations:
-            print(f"Error: Bookings have invalid accommodations: {invalid_accommodations}")
+        invalid_accommodation_mask = missing_id_mask(bookings["AccommodationID"], accommodations["AccommodationID"])
+        if invalid_accommodation_mask.any():
+            invalid_accommodations = bookings.loc[invalid_accommodation_mask, "AccommodationID"].unique()
+            print(f"Error: Bookings have invalid accommodations: {describe_ids(invalid_accommodations)}")
         else:
             print("All bookings reference valid accommodations.")
 
-        if len(accommodations) > len(hosts):
-            print(f"Warning: More accommodations ({len(accommodations)}) than hosts ({len(hosts)}).")
+        num_accommodations, num_hosts = len(accommodations), len(hosts)
+        num_bookings, num_guests = len(bookings), len(guests)
+
+        if num_accommodations > num_hosts:
+            print(f"Warning: More accommodations ({num_accommodations}) than hosts ({num_hosts}).")
         else:
             print("Hosts are sufficient for accommodations.")
 
-        if len(bookings) > len(guests):
-            print(f"Warning: More bookings ({len(bookings)}) than guests ({len(guests)}).")
+        if num_bookings > num_guests:
+            print(f"Warning: More bookings ({num_bookings}) than guests ({num_guests}).")
         else:
             print("Guests are sufficient for bookings.")
 
@@ -2128,114 +2684,201 @@ def verify_data_integrity(users, accommodations, bookings):
         print(f"Error during verification: {e}")
 
 """
-Function: main
+Function: set_seed
 
 Purpose:
-Generates a complete dataset for a system that manages users, accommodations, bookings, and related entities.
-The function sequentially calls specialized table-population functions to create and export data to CSV files 
-for various entities, including users, accommodations, bookings, payments, and reviews. It also validates 
-data integrity and ensures consistency across the generated datasets.
-
-Outputs:
-- Saves each generated dataset to a CSV file.
-- Returns a dictionary (`data`) containing all generated datasets as DataFrames.
-- Prints the status and results of data generation, validation, and consistency checks.
+Reseeds every random source the generators draw from: the shared NumPy generator `rng` and the shared 
+Faker instance.
 
-Use Case:
-Useful for initializing a database or generating synthetic data for testing and development purposes.
+Parameters:
+- seed (int): The seed to apply.
 """
-def main():
-    data = {}
-
-    print("Generating country data...")
-    data["countries"] = populate_country_table(output_filename="countries.csv")
-
-    print("Generating house rule data...")
-    data["house_rules"] = populate_house_rule_table(output_filename="house_rules.csv")
-
-    print("Generating amenity data...")
-    data["amenities"] = populate_amenity_table(output_filename="amenities.csv")
-
-    print("Generating city data...")
-    data["cities"] = populate_city_table(data["countries"], output_filename="cities.csv")
+def set_seed(seed):
+    global rng
+    rng = np.random.default_rng(seed)
+    fake.seed_instance(seed)
 
-    print("Generating user data...")
-    data["users"] = populate_user_table(output_filename="users.csv")
 
-    print("Generating accommodation data...")
-    data["accommodations"] = populate_accommodation_table(data["users"], 
-                                                          data["cities"], data["countries"], output_filename="accommodations.csv")
-
-    print("Generating accommodation photos...")
-    data["photos"] = populate_photo_table(data["accommodations"], output_filename="photos.csv")
-
-    print("Generating accommodation-house rule mappings...")
-    data["accommodation_house_rules"] = populate_accommodation_house_rule_table(
-        data["accommodations"], data["house_rules"], output_filename="accommodation_house_rules.csv"
-    )
-
-    print("Generating accommodation-amenity mappings...")
-    data["accommodation_amenities"] = populate_accommodation_amenity_table(
-        data["accommodations"], data["amenities"], output_filename="accommodation_amenities.csv"
-    )
+"""
+Function: configure_worker
 
-    print("Generating booking data...")
-    data["bookings"] = populate_booking_table(
-        data["users"], data["accommodations"], output_filename="bookings.csv"
-    )
+Purpose:
+Initializes a worker process of `main`'s pool with the run's output directory and write mode, and with the 
+parent's current values of the module settings named in `worker_setting_names`. Forked workers would inherit 
+those anyway, but spawn and forkserver workers re-import the module and would otherwise run on its defaults. 
+Other module-level values are not forwarded and only reach forked workers.
 
-    print("Generating payment data...")
-    data["payments"] = populate_payment_table(data["bookings"], output_filename="payments.csv")
+Parameters:
+- output_dir (str or None): Value for `output_directory` in the worker.
+- deferred_writes (bool): Value for `defer_table_writes` in the worker.
+- settings (dict): Values for the module settings named in `worker_setting_names`.
+"""
+def configure_worker(output_dir, deferred_writes, settings):
+    global output_directory, defer_table_writes
+    output_directory = output_dir
+    defer_table_writes = deferred_writes
+    globals().update(settings)
 
-    print("Generating cancellation data...")
-    data["cancellations"] = populate_cancellation_table(data["bookings"], output_filename="cancellations.csv")
 
-    print("Generating availability data...")
-    data["availability"] = populate_availability_table(
-        data["accommodations"], data["bookings"], output_filename="availability.csv"
-    )
+"""
+Function: run_seeded
 
-    print("Generating price data...")
-    data["prices"] = populate_price_table(data["accommodations"], output_filename="prices.csv")
+Purpose:
+Runs a table-population function inside a worker process after reseeding every random source the 
+generators draw from. Forked workers inherit the parent's RNG state, so without reseeding they would 
+all produce the same random sequence. The function's status messages are collected in memory and handed 
+back with its result, so the parent writes each table's log as one block instead of workers writing and 
+interleaving line by line. If `func` raises, the text printed so far is attached to the exception as its 
+`stage_log` attribute, which travels back to the parent with it.
 
-    print("Generating social network data...")
-    data["social_networks"] = populate_social_network_table(data["users"], output_filename="social_networks.csv")
+Parameters:
+- seed (int): The seed passed to `set_seed`.
+- func (callable): The `populate_*` function to run.
+- *args, **kwargs: Arguments forwarded to `func`.
 
-    print("Generating profile data...")
-    data["profiles"] = populate_profile_table(data["users"], output_filename="profiles.csv")
+Returns:
+- A tuple of the DataFrame returned by `func` and the text it printed.
+"""
+def run_seeded(seed, func, *args, **kwargs):
+    set_seed(seed)
+    stage_log = io.StringIO()
+    try:
+        with redirect_stdout(stage_log):
+            result = func(*args, **kwargs)
+    except Exception as error:
+        error.stage_log = stage_log.getvalue()
+        raise
+    return result, stage_log.getvalue()
+
+
+# tables main generates, as (table name, progress label, populate function, input tables, keyword arguments
+# filled with the UserIDs of one user type); each table is written to "<table name>.csv", seeded by its
+# position in this list and submitted as soon as all of its input tables exist
+table_stages = [
+    ("countries", "country data", populate_country_table, (), {}),
+    ("users", "user data", populate_user_table, (), {}),
+    ("house_rules", "house rule data", populate_house_rule_table, (), {}),
+    ("amenities", "amenity data", populate_amenity_table, (), {}),
+    ("cities", "city data", populate_city_table, ("countries",), {}),
+    ("accommodations", "accommodation data", populate_accommodation_table, ("users", "cities", "countries"),
+     {"valid_hosts": "host"}),
+    ("photos", "accommodation photos", populate_photo_table, ("accommodations",), {}),
+    ("bookings", "booking data", populate_booking_table, ("users", "accommodations"),
+     {"guest_ids": "guest"}),
+    ("accommodation_house_rules", "accommodation-house rule mappings", populate_accommodation_house_rule_table,
+     ("accommodations", "house_rules"), {}),
+    ("accommodation_amenities", "accommodation-amenity mappings", populate_accommodation_amenity_table,
+     ("accommodations", "amenities"), {}),
+    ("cancellations", "cancellation data", populate_cancellation_table, ("bookings",), {}),
+    ("availability", "availability data", populate_availability_table, ("accommodations", "bookings"), {}),
+    ("payments", "payment data", populate_payment_table, ("bookings",), {}),
+    ("prices", "price data", populate_price_table, ("accommodations",), {}),
+    ("social_networks", "social network data", populate_social_network_table, ("users",), {}),
+    ("profiles", "profile data", populate_profile_table, ("users",), {}),
+    ("messages", "user messages", populate_message_table, ("users",), {}),
+    ("reviews", "review data", populate_review_table, ("accommodations", "bookings", "users"), {}),
+    ("host_responses", "host responses", populate_host_response_table, ("reviews",), {}),
+    ("commissions", "commission data", populate_commission_table, ("bookings",), {}),
+    ("admins", "admin data", populate_admin_table, ("users",), {}),
+    ("admin_actions", "admin actions", populate_admin_action_table, ("admins",), {}),
+    ("transactions", "transaction data", populate_transaction_table, ("payments",), {}),
+    ("notifications", "notifications", populate_notification_table, ("users",), {}),
+]
 
-    print("Generating user messages...")
-    data["messages"] = populate_message_table(data["users"], output_filename="messages.csv")
 
-    print("Generating review data...")
-    data["reviews"] = populate_review_table(
-        data["accommodations"], data["bookings"], data["users"], output_filename="reviews.csv"
-    )
+"""
+Function: main
 
-    if not data["reviews"].empty:
-        print("Generating host responses...")
-        data["host_responses"] = populate_host_response_table(data["reviews"], output_filename="host_responses.csv")
-    else:
-        print("No reviews generated. Skipping host responses.")
-        data["host_responses"] = pd.DataFrame()
+Purpose:
+Generates a complete dataset for a system that manages users, accommodations, bookings, and related entities.
+The function calls specialized table-population functions to create and export data to CSV files 
+for various entities, including users, accommodations, bookings, payments, and reviews. It also validates 
+data integrity and ensures consistency across the generated datasets.
 
-    print("Generating commission data...")
-    data["commissions"] = populate_commission_table(data["bookings"], output_filename="commissions.csv")
+Parameters:
+- max_workers (int, optional): Number of worker processes used for the tables whose inputs are ready. 
+  Defaults to the number of CPUs.
+- base_seed (int, optional): Seed from which each worker task derives its own seed. Drawn at random if not provided.
+- aggregate (bool, optional): When True, the tables are not written one file each; all of them are saved into 
+  the single SQLite database `aggregate_filename` once generation has finished. Defaults to False. Needs an 
+  output directory; combined with `output_dir=None` it raises a ValueError.
+- output_dir (str or None, optional): Directory the tables are written to (default: the value 
+  `output_directory` has when `main` is called). With None nothing is written at all and the tables are only 
+  returned, e.g. for tests and benchmarks.
+- verify (bool, optional): Whether to run `verify_data_integrity` and `validate_tables` after generation. 
+  Defaults to True.
 
-    print("Generating admin data...")
-    data["admins"] = populate_admin_table(data["users"], output_filename="admins.csv")
+Key Features:
+- Drives generation from the declarative `table_stages` list, whose input tables form a dependency graph.
+- Submits each stage to a worker process as soon as all of its input tables exist; the leaves (countries, 
+  users, house rules, amenities) start at once and runtime follows the graph's critical path 
+  users -> accommodations -> bookings -> reviews -> host responses rather than the sum of all stages.
+- Seeds every worker task separately so parallel tables do not repeat each other's random draws.
+- Writes each table's status messages in one block when the table finishes, so parallel tables do not 
+  interleave their output.
+- If a stage raises, writes the messages it printed before failing, cancels the stages that have not 
+  started yet and re-raises the error.
 
-    print("Generating admin actions...")
-    data["admin_actions"] = populate_admin_action_table(data["admins"], output_filename="admin_actions.csv")
+Outputs:
+- Saves each generated dataset to a CSV file, or all of them to one SQLite database in aggregate mode.
+- Returns a dictionary (`data`) containing all generated datasets as DataFrames.
+- Prints the status and results of data generation, validation, and consistency checks.
 
-    print("Generating transaction data...")
-    data["transactions"] = populate_transaction_table(data["payments"], output_filename="transactions.csv")
+Use Case:
+Useful for initializing a database or generating synthetic data for testing and development purposes.
+"""
+def main(max_workers=None, base_seed=None, aggregate=False, output_dir=..., verify=True):
+    if output_dir is ...:
+        output_dir = output_directory
+    if aggregate and output_dir is None:
+        raise ValueError("Aggregate mode needs an output directory to write the database to.")
 
-    print("Generating notifications...")
-    data["notifications"] = populate_notification_table(data["users"], output_filename="notifications.csv")
+    data = {}
+    base_seed = int(rng.integers(2**32)) if base_seed is None else base_seed
+    user_type_index = {}
+    empty_ids = np.array([], dtype=np.int64)
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), initializer=configure_worker,
+                             initargs=(output_dir, aggregate or output_dir is None,
+                                       {name: globals()[name] for name in worker_setting_names})) as executor:
+        pending = list(enumerate(table_stages, start=1))
+        running = {}
+        while pending or running:
+            waiting = []
+            for task_id, (name, label, func, inputs, user_type_args) in pending:
+                if not all(table in data for table in inputs):
+                    waiting.append((task_id, (name, label, func, inputs, user_type_args)))
+                else:
+                    print(f"Generating {label}...")
+                    kwargs = {arg: user_type_index.get(user_type, empty_ids) for arg, user_type in user_type_args.items()}
+                    future = executor.submit(run_seeded, base_seed ^ task_id, func,
+                                             *(data[table] for table in inputs),
+                                             output_filename=f"{name}.csv", **kwargs)
+                    running[future] = name
+            pending = waiting
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    data[name], stage_log = future.result()
+                except Exception as error:
+                    # show what the failed stage printed and do not start the stages still queued
+                    sys.stdout.write(getattr(error, "stage_log", ""))
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                sys.stdout.write(stage_log)
+                if name == "users":
+                    user_type_index.update(build_user_type_index(data["users"]))
+
+    if aggregate:
+        print(f"All tables saved to: {save_tables_to_database(data, output_dir=output_dir)}")
 
     print("All data generation complete!")
 
+    if not verify:
+        return data
+
     verify_data_integrity(data["users"], data["accommodations"], data["bookings"])
 
     print(f"Data Types Before Validation:")
@@ -2252,5 +2895,7 @@ def main():
         for issue in validation_result:
             print(f"- {issue}")
 
+    return data
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,282 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+import numpy as np
+import pandas as pd
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import generate_data  # noqa: E402
+
+# columns derived from Faker's "this year"/"this decade" providers move with the wall clock between runs
+TIME_COLUMN_MARKERS = ("Date", "LastLogin", "LastUpdated", "CreatedAt", "UpdatedAt")
+
+
+def without_time_columns(df):
+    return df.drop(columns=[column for column in df.columns if any(marker in column for marker in TIME_COLUMN_MARKERS)])
+
+
+def read_tables(output_dir):
+    readers = {".csv": pd.read_csv, ".parquet": pd.read_parquet}
+    return {
+        os.path.splitext(filename)[0]: readers[os.path.splitext(filename)[1]](os.path.join(output_dir, filename))
+        for filename in sorted(os.listdir(output_dir))
+    }
+
+
+def run_main_in_subprocess(work_dir, base_seed):
+    # a fresh interpreter per run, so nothing (e.g. NumPy's global random state) carries over between runs
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {REPO_DIR!r})\n"
+        "import generate_data\n"
+        f"generate_data.main(base_seed={base_seed})\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=work_dir, check=True, stdout=subprocess.DEVNULL)
+    return read_tables(os.path.join(work_dir, generate_data.output_directory))
+
+
+def run_main_into(output_dir, base_seed, **settings):
+    # runs main in this process, writing into output_dir with the given module settings; returns what it printed
+    output = io.StringIO()
+    with unittest.mock.patch.dict(vars(generate_data), settings), contextlib.redirect_stdout(output):
+        generate_data.main(base_seed=base_seed, output_dir=output_dir)
+    return output.getvalue()
+
+
+def populate_echo_table(value, output_filename):
+    print(f"Echo table built from {value}.")
+    return value
+
+
+def populate_failing_table(output_filename):
+    print("Half of the failing table generated.")
+    raise RuntimeError("stage failed")
+
+
+def populate_dependent_table(failing, output_filename):
+    raise AssertionError("a stage whose input failed was started")
+
+
+def populate_empty_review_table(output_filename):
+    return pd.DataFrame(columns=["ReviewID", "AccommodationID", "UserID", "ReviewText", "Rating", "ReviewDate"])
+
+
+class MainReproducibilityTest(unittest.TestCase):
+    def test_same_base_seed_gives_same_tables_across_processes(self):
+        with tempfile.TemporaryDirectory() as first_dir, tempfile.TemporaryDirectory() as second_dir:
+            first = run_main_in_subprocess(first_dir, base_seed=7)
+            second = run_main_in_subprocess(second_dir, base_seed=7)
+
+        self.assertEqual(sorted(first), sorted(second))
+        for name in first:
+            with self.subTest(table=name):
+                self.assertTrue(without_time_columns(first[name]).equals(without_time_columns(second[name])))
+
+
+@unittest.skipIf(generate_data.pa is None, "pyarrow is not installed")
+class SaveTableFormatTest(unittest.TestCase):
+    def assert_same_bytes_as_pandas(self, df):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with unittest.mock.patch.object(generate_data, "output_directory", output_dir):
+                path = generate_data.save_table(df, "table.csv")
+            with open(path, "rb") as handle:
+                written = handle.read()
+        self.assertEqual(written, df.to_csv(index=False).encode())
+
+    def test_integer_table_matches_to_csv(self):
+        self.assert_same_bytes_as_pandas(pd.DataFrame({
+            "BookingID": np.arange(1, 6, dtype=np.int64),
+            "Guests": np.array([1, 2, 3, 4, 200], dtype=np.int32),
+        }))
+
+    def test_text_table_matches_to_csv(self):
+        df = pd.DataFrame({
+            "UserID": np.arange(1, 4),
+            "Name": ["plain", "with, comma", 'with "quotes"'],
+            "Note": ["x", None, "multi\nline"],
+        })
+        self.assert_same_bytes_as_pandas(df)
+        self.assert_same_bytes_as_pandas(generate_data.as_text_columns(df, ["Name", "Note"]))
+
+
+class SampleCoveringPairsTest(unittest.TestCase):
+    def sample_pairs(self, seed, *sizes):
+        generate_data.set_seed(seed)
+        rows, columns = generate_data.sample_covering_pairs(*sizes)
+        return rows.tolist(), columns.tolist()
+
+    def test_pairs_are_distinct_cover_every_row_and_follow_the_seed(self):
+        # a sparse draw (bitset kernel when Numba is installed) and a dense one (enumerated codes)
+        for num_rows, num_columns, total_entries in [(50, 20, 150), (50, 20, 900)]:
+            with self.subTest(sizes=(num_rows, num_columns, total_entries)):
+                rows, columns = self.sample_pairs(11, num_rows, num_columns, total_entries)
+                self.assertEqual(len(set(zip(rows, columns))), total_entries)
+                self.assertEqual(set(rows), set(range(num_rows)))
+                self.assertTrue(all(0 <= column < num_columns for column in columns))
+                self.assertEqual(self.sample_pairs(11, num_rows, num_columns, total_entries), (rows, columns))
+
+    def test_pairs_do_not_depend_on_numba(self):
+        # sparse and dense draws, and a pair space too large to enumerate
+        kernel = getattr(generate_data._sample_unused_codes, "py_func", generate_data._sample_unused_codes)
+        for sizes in [(50, 20, 150), (50, 20, 900), (3000, 2000, 20_000)]:
+            with self.subTest(sizes=sizes):
+                with unittest.mock.patch.multiple(generate_data, njit=True, _sample_unused_codes=kernel):
+                    one_at_a_time = self.sample_pairs(11, *sizes)
+                    next_draw = generate_data.rng.random()
+                with unittest.mock.patch.object(generate_data, "njit", None):
+                    batched = self.sample_pairs(11, *sizes)
+                    self.assertEqual(generate_data.rng.random(), next_draw)
+                self.assertEqual(one_at_a_time, batched)
+                if generate_data.njit is not None:
+                    self.assertEqual(self.sample_pairs(11, *sizes), batched)
+
+
+class MainSchedulingTest(unittest.TestCase):
+    # (table, column, referenced table, referenced column) for tables built from the output of another stage
+    references = [
+        ("cities", "CountryID", "countries", "CountryID"),
+        ("accommodations", "CityID", "cities", "CityID"),
+        ("photos", "AccommodationID", "accommodations", "AccommodationID"),
+        ("bookings", "AccommodationID", "accommodations", "AccommodationID"),
+        ("accommodation_amenities", "AmenityID", "amenities", "AmenityID"),
+        ("accommodation_house_rules", "HouseRuleID", "house_rules", "HouseRuleID"),
+        ("cancellations", "BookingID", "bookings", "BookingID"),
+        ("payments", "BookingID", "bookings", "BookingID"),
+        ("transactions", "PaymentID", "payments", "PaymentID"),
+        ("host_responses", "ReviewID", "reviews", "ReviewID"),
+        ("admin_actions", "AdminID", "admins", "AdminID"),
+    ]
+
+    def test_every_stage_runs_after_its_inputs(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            output = run_main_into(output_dir, base_seed=3)
+            tables = read_tables(output_dir)
+
+        self.assertEqual(len(tables), 24)
+        self.assertNotIn("Error", output)
+        # the workers' status messages are handed back and written by the parent
+        self.assertIn("User table data saved to:", output)
+        for table, column, referenced_table, referenced_column in self.references:
+            with self.subTest(table=table):
+                self.assertTrue(tables[table][column].isin(tables[referenced_table][referenced_column]).all())
+
+    def test_host_responses_without_reviews_come_back_empty(self):
+        stages = [
+            ("reviews", "review data", populate_empty_review_table, (), {}),
+            ("host_responses", "host responses", generate_data.populate_host_response_table, ("reviews",), {}),
+        ]
+        output = io.StringIO()
+        with unittest.mock.patch.object(generate_data, "table_stages", stages), contextlib.redirect_stdout(output):
+            data = generate_data.main(base_seed=3, output_dir=None, verify=False)
+
+        self.assertTrue(data["host_responses"].empty)
+        self.assertEqual(list(data["host_responses"].columns), ["ReviewID", "ResponseText"])
+        self.assertIn("Reviews DataFrame is empty", output.getvalue())
+
+
+class RunSeededTest(unittest.TestCase):
+    def test_printed_text_is_returned_with_the_result(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result, stage_log = generate_data.run_seeded(1, populate_echo_table, "x", output_filename="echo.csv")
+
+        self.assertEqual(result, "x")
+        self.assertEqual(stage_log, "Echo table built from x.\n")
+        self.assertEqual(output.getvalue(), "")
+
+
+@unittest.skipIf(generate_data.pa is None, "pyarrow is not installed")
+class ParquetOutputTest(unittest.TestCase):
+    def test_parquet_mode_writes_every_table_as_parquet(self):
+        with tempfile.TemporaryDirectory() as csv_dir, tempfile.TemporaryDirectory() as parquet_dir:
+            run_main_into(csv_dir, base_seed=5)
+            output = run_main_into(parquet_dir, base_seed=5, table_file_format="parquet")
+            csv_tables = read_tables(csv_dir)
+            parquet_filenames = sorted(os.listdir(parquet_dir))
+            parquet_tables = read_tables(parquet_dir)
+
+        self.assertNotIn("Error", output)
+        self.assertTrue(all(filename.endswith(".parquet") for filename in parquet_filenames))
+        self.assertEqual(sorted(parquet_tables), sorted(csv_tables))
+        for name, table in parquet_tables.items():
+            with self.subTest(table=name):
+                self.assertEqual(list(table.columns), list(csv_tables[name].columns))
+                self.assertEqual(len(table), len(csv_tables[name]))
+
+    def test_parquet_mode_reaches_spawned_workers(self):
+        # spawned workers re-import generate_data, so they only see settings main passes on explicitly
+        with tempfile.TemporaryDirectory() as output_dir:
+            script = (
+                "import multiprocessing, sys\n"
+                f"sys.path.insert(0, {REPO_DIR!r})\n"
+                "import generate_data\n"
+                "multiprocessing.set_start_method('spawn')\n"
+                "generate_data.table_file_format = 'parquet'\n"
+                f"generate_data.main(base_seed=5, output_dir={output_dir!r}, verify=False)\n"
+            )
+            subprocess.run([sys.executable, "-c", script], cwd=output_dir, check=True, stdout=subprocess.DEVNULL)
+            filenames = os.listdir(output_dir)
+
+        self.assertEqual(len(filenames), 24)
+        self.assertTrue(all(filename.endswith(".parquet") for filename in filenames))
+
+
+class OutputDirectoryTest(unittest.TestCase):
+    def test_main_writes_to_the_current_output_directory(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with unittest.mock.patch.object(generate_data, "output_directory", output_dir), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                generate_data.main(base_seed=3, verify=False)
+            self.assertEqual(len(os.listdir(output_dir)), 24)
+
+    def test_run_without_output_directory_touches_no_files(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            script = (
+                "import sys\n"
+                f"sys.path.insert(0, {REPO_DIR!r})\n"
+                "import generate_data\n"
+                "generate_data.main(base_seed=3, output_dir=None, verify=False)\n"
+            )
+            subprocess.run([sys.executable, "-c", script], cwd=work_dir, check=True, stdout=subprocess.DEVNULL)
+            self.assertEqual(os.listdir(work_dir), [])
+
+    def test_aggregate_mode_needs_an_output_directory(self):
+        with self.assertRaisesRegex(ValueError, "output directory"):
+            generate_data.main(aggregate=True, output_dir=None)
+
+
+class DefaultRunTest(unittest.TestCase):
+    def test_default_sizes_give_enough_hosts(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            generate_data.main(base_seed=13, output_dir=None)
+
+        self.assertIn("Hosts are sufficient for accommodations.", output.getvalue())
+
+
+class StageFailureTest(unittest.TestCase):
+    def test_failed_stage_log_is_written_and_error_raised(self):
+        stages = [
+            ("failing", "failing data", populate_failing_table, (), {}),
+            ("dependent", "dependent data", populate_dependent_table, ("failing",), {}),
+        ]
+        output = io.StringIO()
+        with unittest.mock.patch.object(generate_data, "table_stages", stages), \
+                contextlib.redirect_stdout(output):
+            with self.assertRaisesRegex(RuntimeError, "stage failed"):
+                generate_data.main(base_seed=3, output_dir=None, verify=False)
+
+        self.assertIn("Half of the failing table generated.", output.getvalue())
+        self.assertNotIn("Generating dependent data", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()